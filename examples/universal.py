@@ -6,6 +6,7 @@ import os
 import sys
 import threading
 import time
+from functools import lru_cache
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_DIR = os.path.dirname(SCRIPT_DIR)
@@ -14,32 +15,96 @@ sys.path.insert(0, PROJECT_DIR)
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLineEdit, QLabel, QScrollArea, QFrame, QListWidget, QListWidgetItem,
-    QGridLayout, QPushButton, QProgressBar, QComboBox,
+    QListView, QPushButton, QProgressBar, QComboBox,
+)
+from PySide6.QtCore import (
+    Qt, QSize, QEvent, QPoint, QRect, Signal, QTimer, QAbstractListModel,
+    QObject, QRunnable, QThreadPool,
+)
+from PySide6.QtGui import (
+    QPixmap, QPixmapCache, QImage, QIcon, QPainter, QPainterPath, QWindow, QCursor, QFont, QColor,
 )
-from PySide6.QtCore import Qt, QSize, QEvent, QPoint, QRect, Signal, QTimer
-from PySide6.QtGui import QPixmap, QIcon, QPainter, QPainterPath, QCursor
 
 from seed import generate_words, get_fingerprint, get_seed, get_entropy_bits, mouse_entropy, resolve, search, verify_randomness, get_languages, verify_checksum, get_profile
 from languages.base import signer_universal_seed_base
 
 ICONS_DIR = os.path.join(PROJECT_DIR, "visuals", "png")
-BASE_LOOKUP = {entry[0]: (entry[1], entry[2]) for entry in signer_universal_seed_base}
+# Base table as parallel lists indexed by icon id (ids are dense 0..255)
+_BASE_EMOJI = ["?"] * 256
+_BASE_WORD = ["?"] * 256
+for _idx, _emoji, _word in signer_universal_seed_base:
+    _BASE_EMOJI[_idx] = _emoji
+    _BASE_WORD[_idx] = _word
 ICON_SIZE = 36
+DEBUG_TIMING = bool(os.environ.get("SEED_DEBUG"))  # Per-event timing/trace prints
+_PASTE_TRANS = str.maketrans(",", " ")  # Commas separate like whitespace on paste
+# "n / total" status texts for both word counts, built once
+_COUNT_TEXT = {(n, t): f"{n} / {t}" for t in (24, 36) for n in range(t + 1)}
 
-_icon_cache = {}
+# Scaled icons live in QPixmapCache (Qt-managed, evictable); only the
+# indexes without a PNG are remembered here so we don't stat them again.
+_missing_icons = set()
+_qicon_cache = {}
+_rounded_cache = {}
+_glyph_cache = {}
 
 
 def load_icon(index, size=ICON_SIZE):
+    if index in _missing_icons:
+        return None
+    key = f"icon:{index}:{size}"
+    pm = QPixmapCache.find(key)
+    if pm is None:
+        path = os.path.join(ICONS_DIR, f"{index}.png")
+        if not os.path.exists(path):
+            _missing_icons.add(index)
+            return None
+        pm = QPixmap(path).scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        QPixmapCache.insert(key, pm)
+    return pm
+
+
+@lru_cache(maxsize=4096)
+def _label_for(idx, word):
+    """Suggestion row text: "[idx]  word" plus the English base word if different."""
+    base = _BASE_WORD[idx]
+    return f"[{idx}]  {word}    —  {base}" if word != base else f"[{idx}]  {word}"
+
+
+def load_qicon(index, size=24):
+    """Cached QIcon wrapper around load_icon (empty QIcon if missing)."""
     key = (index, size)
-    if key not in _icon_cache:
+    icon = _qicon_cache.get(key)
+    if icon is None:
+        pm = load_icon(index, size)
+        icon = QIcon(pm) if pm else QIcon()
+        _qicon_cache[key] = icon
+    return icon
+
+
+def _load_icon_images(sizes=(24, 32, ICON_SIZE)):
+    """Decode and scale every icon as QImage (safe off the GUI thread)."""
+    images = []
+    for index in range(256):
         path = os.path.join(ICONS_DIR, f"{index}.png")
-        if os.path.exists(path):
-            _icon_cache[key] = QPixmap(path).scaled(
-                size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation
-            )
-        else:
-            _icon_cache[key] = None
-    return _icon_cache[key]
+        img = QImage(path) if os.path.exists(path) else QImage()
+        for size in sizes:
+            scaled = None
+            if not img.isNull():
+                scaled = img.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            images.append(((index, size), scaled))
+    return images
+
+
+def store_icon_images(images):
+    """Convert preloaded QImages to QPixmaps in the cache (GUI thread only)."""
+    for (index, size), img in images:
+        if img is None:
+            _missing_icons.add(index)
+            continue
+        key = f"icon:{index}:{size}"
+        if QPixmapCache.find(key) is None:
+            QPixmapCache.insert(key, QPixmap.fromImage(img))
 
 
 def rounded_pixmap(pm, radius=6):
@@ -55,6 +120,34 @@ def rounded_pixmap(pm, radius=6):
     return out
 
 
+def load_rounded(index, size=ICON_SIZE, radius=8):
+    """Cached rounded_pixmap of an icon (None if the icon is missing)."""
+    key = (index, size, radius)
+    if key not in _rounded_cache:
+        pm = load_icon(index, size)
+        _rounded_cache[key] = rounded_pixmap(pm, radius) if pm else None
+    return _rounded_cache[key]
+
+
+def glyph_pixmap(ch, color, size=16):
+    """Cached pixmap of a single colored glyph (e.g. the pass/fail marks)."""
+    key = (ch, color, size)
+    pm = _glyph_cache.get(key)
+    if pm is None:
+        pm = QPixmap(size, size)
+        pm.fill(Qt.transparent)
+        font = QFont()
+        font.setPixelSize(size)
+        p = QPainter(pm)
+        p.setRenderHint(QPainter.TextAntialiasing)
+        p.setFont(font)
+        p.setPen(QColor(color))
+        p.drawText(pm.rect(), Qt.AlignCenter, ch)
+        p.end()
+        _glyph_cache[key] = pm
+    return pm
+
+
 # ── Light theme styles ─────────────────────────────────────
 
 STYLE = """
@@ -109,11 +202,22 @@ QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0; }
 """
 
 ICON_PICKER_STYLE = """
-QScrollArea {
+QListView {
     background: #ffffff;
     border: 1px solid #d8d8e0;
     border-radius: 10px;
+    padding: 6px;
+    outline: none;
+}
+QListView::item {
+    background: #f8f8fa;
+    border: 1px solid #e8e8ee;
+    border-radius: 6px;
+    margin: 2px;
+    color: #888;
+    font-size: 9px;
 }
+QListView::item:hover { background: #e8e8f0; border-color: #c0c0d0; }
 QScrollBar:vertical {
     background: transparent; width: 5px; margin: 4px 1px;
 }
@@ -126,6 +230,7 @@ QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0; }
 
 class SuggestionPopup(QListWidget):
     word_selected = Signal(str)
+    MAX_ITEMS = 8
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -136,7 +241,18 @@ class SuggestionPopup(QListWidget):
         self.setCursor(Qt.PointingHandCursor)
         self.setStyleSheet(POPUP_STYLE)
         self.itemClicked.connect(self._on_item_clicked)
-        self._filter_installed = False
+        self._filter_target = None  # Top-level window while shown
+        # Fixed pool of rows, updated in place on every keystroke
+        self._pool = []
+        for _ in range(self.MAX_ITEMS):
+            item = QListWidgetItem("")
+            item.setHidden(True)
+            self.addItem(item)
+            self._pool.append(item)
+        # Suggestion words per pool slot, kept Python-side (items hold no data roles)
+        self._words = [None] * self.MAX_ITEMS
+        self.visible_count = 0
+        self._last_geom = None  # (w, h, x, y) last applied in show_for
         self.hide()
 
     def mouseMoveEvent(self, event):
@@ -147,10 +263,22 @@ class SuggestionPopup(QListWidget):
             self.setCurrentItem(item)
         super().mouseMoveEvent(event)
 
-    def show_for(self, suggestions, anchor_widget):
+    def word_for(self, item):
+        """Suggestion word shown by a pool item, or None."""
+        if item is None:
+            return None
+        return self._words[self.row(item)]
+
+    def show_for(self, suggestions, anchor_widget, pos=None):
+        """Show suggestions under anchor_widget.
+
+        pos is the popup's top-left in window coordinates; callers that
+        cache it skip the mapTo() walk up the widget tree.
+        """
         t0 = time.perf_counter()
-        self.clear()
+        suggestions = suggestions[:self.MAX_ITEMS]
         if not suggestions:
+            self.visible_count = 0
             self.hide()
             return
 
@@ -161,57 +289,73 @@ class SuggestionPopup(QListWidget):
             self.setStyleSheet(POPUP_STYLE)
 
         t1 = time.perf_counter()
-        for word, idx in suggestions:
-            _, base = BASE_LOOKUP.get(idx, ("?", "?"))
-            label = f"[{idx}]  {word}    —  {base}" if word != base else f"[{idx}]  {word}"
-            item = QListWidgetItem(label)
-            item.setData(Qt.UserRole, word)
-            pm = load_icon(idx, 24)
-            if pm:
-                item.setIcon(QIcon(pm))
-            self.addItem(item)
+        self.setCurrentRow(-1)
+        for i, (word, idx) in enumerate(suggestions):
+            item = self._pool[i]
+            self._words[i] = word
+            item.setText(_label_for(idx, word))
+            item.setIcon(load_qicon(idx, 24))
+            item.setHidden(False)
+        for item in self._pool[len(suggestions):]:
+            item.setHidden(True)
+        self.visible_count = len(suggestions)
         t2 = time.perf_counter()
 
         visible = min(len(suggestions), 7)
         h = max(visible * 36 + 16, 52)
         w = max(anchor_widget.width(), 280)
-        self.setFixedSize(w, h)
-        pos = anchor_widget.mapTo(top, QPoint(0, anchor_widget.height() + 4))
-        self.move(pos)
-        self.raise_()
-        self.show()
-        if not self._filter_installed:
-            QApplication.instance().installEventFilter(self)
-            self._filter_installed = True
+        if pos is None:
+            pos = anchor_widget.mapTo(top, QPoint(0, anchor_widget.height() + 4))
+        geom = (w, h, pos.x(), pos.y())
+        if geom != self._last_geom:
+            self.setFixedSize(w, h)
+            self.move(pos)
+            self._last_geom = geom
+        if not self.isVisible():
+            self.raise_()
+            self.show()
+        if self._filter_target is None:
+            top.installEventFilter(self)
+            self._filter_target = top
         t3 = time.perf_counter()
-        print(f"  [show_for] items={len(suggestions)} setup={(t1-t0)*1000:.2f}ms build={(t2-t1)*1000:.2f}ms layout={(t3-t2)*1000:.2f}ms total={(t3-t0)*1000:.2f}ms")
+        if DEBUG_TIMING:
+            print(f"  [show_for] items={len(suggestions)} setup={(t1-t0)*1000:.2f}ms build={(t2-t1)*1000:.2f}ms layout={(t3-t2)*1000:.2f}ms total={(t3-t0)*1000:.2f}ms")
 
     def hide(self):
-        if self._filter_installed:
-            import traceback
-            print(f"  [popup.hide] was visible, removing event filter")
-            print(f"    caller: {traceback.format_stack()[-2].strip()}")
-            QApplication.instance().removeEventFilter(self)
-            self._filter_installed = False
+        if self._filter_target is not None:
+            if DEBUG_TIMING:
+                print(f"  [popup.hide] was visible, removing event filter")
+            try:
+                self._filter_target.removeEventFilter(self)
+            except RuntimeError:
+                pass  # Window already destroyed (shutdown with popup open)
+            self._filter_target = None
         super().hide()
 
     def _on_item_clicked(self, item):
         t0 = time.perf_counter()
-        word = item.data(Qt.UserRole)
-        print(f"  [popup._on_item_clicked] word='{word}'")
+        word = self.word_for(item)
+        if DEBUG_TIMING:
+            print(f"  [popup._on_item_clicked] word='{word}'")
         if word:
             self.word_selected.emit(word)
         self.hide()
-        print(f"  [popup._on_item_clicked] done  ({(time.perf_counter()-t0)*1000:.2f}ms)")
+        if DEBUG_TIMING:
+            print(f"  [popup._on_item_clicked] done  ({(time.perf_counter()-t0)*1000:.2f}ms)")
 
     def eventFilter(self, obj, event):
-        """App-level filter: dismiss popup when clicking outside it."""
+        """Window filter: dismiss popup when clicking outside it.
+
+        Only presses that propagate up to the window arrive here; clicks on
+        focusable widgets are covered by the row's FocusOut handling.
+        """
         if event.type() == QEvent.MouseButtonPress and self.isVisible():
             t0 = time.perf_counter()
             click_pos = event.globalPosition().toPoint()
             popup_rect = QRect(self.mapToGlobal(QPoint(0, 0)), self.size())
             inside = popup_rect.contains(click_pos)
-            print(f"  [popup.eventFilter] MouseButtonPress inside={inside} obj={type(obj).__name__}  ({(time.perf_counter()-t0)*1000:.2f}ms)")
+            if DEBUG_TIMING:
+                print(f"  [popup.eventFilter] MouseButtonPress inside={inside} obj={type(obj).__name__}  ({(time.perf_counter()-t0)*1000:.2f}ms)")
             if inside:
                 return False  # Let click reach popup items
             self.hide()  # Click outside — just dismiss, no auto-select
@@ -219,87 +363,91 @@ class SuggestionPopup(QListWidget):
         return False
 
 
+class IconGridModel(QAbstractListModel):
+    """The 256 base icons as a list model — the view only paints visible cells."""
+
+    def rowCount(self, parent=None):
+        return 256
+
+    def data(self, index, role=Qt.DisplayRole):
+        idx = index.row()
+        if role == Qt.DecorationRole:
+            return load_qicon(idx, 32)
+        if role == Qt.DisplayRole:
+            # Text fallback only when the icon file is missing
+            if load_icon(idx, 32) is None:
+                return _BASE_WORD[idx][:3]
+            return None
+        if role == Qt.ToolTipRole:
+            return f"{idx}: {_BASE_WORD[idx]}"
+        return None
+
+
 class IconPickerPopup(QFrame):
-    """Grid popup showing all 256 icons for visual selection."""
-    icon_selected = Signal(int)
+    """Grid popup showing all 256 icons for visual selection.
+
+    A single instance is shared by all rows; show_at() records which row
+    opened it so the selection can be routed back.
+    """
+    icon_selected = Signal(object, int)  # (row, icon_index)
 
     def __init__(self, parent=None):
         super().__init__(parent)
         # No Qt.ToolTip — child widget of the main window
         self.setFocusPolicy(Qt.NoFocus)
         self.setFixedSize(380, 340)
-        self._filter_installed = False
+        self._filter_target = None  # Top-level window while shown
         self._anchor = None
+        self._row = None
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
 
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll.setStyleSheet(ICON_PICKER_STYLE)
-        layout.addWidget(scroll)
+        self._model = IconGridModel(self)
+        view = QListView()
+        view.setModel(self._model)
+        view.setViewMode(QListView.IconMode)
+        view.setMovement(QListView.Static)
+        view.setResizeMode(QListView.Adjust)
+        view.setUniformItemSizes(True)
+        view.setIconSize(QSize(32, 32))
+        view.setGridSize(QSize(44, 44))
+        view.setSelectionMode(QListView.NoSelection)
+        view.setFocusPolicy(Qt.NoFocus)
+        view.setMouseTracking(True)
+        view.setCursor(Qt.PointingHandCursor)
+        view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        view.setStyleSheet(ICON_PICKER_STYLE)
+        view.clicked.connect(self._on_clicked)
+        layout.addWidget(view)
+        # Clicks on focusable widgets never reach the window filter
+        QApplication.instance().focusChanged.connect(self._on_focus_changed)
+        self.hide()
 
-        container = QWidget()
-        container.setStyleSheet("background: #ffffff;")
-        grid = QGridLayout(container)
-        grid.setContentsMargins(8, 8, 8, 8)
-        grid.setSpacing(4)
-
-        cols = 8
-        for idx in range(256):
-            btn = QLabel()
-            btn.setFixedSize(40, 40)
-            btn.setAlignment(Qt.AlignCenter)
-            btn.setCursor(Qt.PointingHandCursor)
-            btn.setProperty("icon_index", idx)
-            btn.setStyleSheet(
-                "QLabel { background: #f8f8fa; border: 1px solid #e8e8ee; border-radius: 6px; }"
-                "QLabel:hover { background: #e8e8f0; border-color: #c0c0d0; }"
-            )
-            pm = load_icon(idx, 32)
-            if pm:
-                btn.setPixmap(pm)
-            else:
-                _, word = BASE_LOOKUP.get(idx, ("?", "?"))
-                btn.setText(word[:3])
-                btn.setStyleSheet(
-                    "QLabel { background: #f8f8fa; border: 1px solid #e8e8ee; border-radius: 6px;"
-                    " font-size: 9px; color: #888; }"
-                    "QLabel:hover { background: #e8e8f0; border-color: #c0c0d0; }"
-                )
-
-            btn.setToolTip(f"{idx}: {BASE_LOOKUP.get(idx, ('?','?'))[1]}")
-            btn.installEventFilter(self)
-            grid.addWidget(btn, idx // cols, idx % cols)
+    def _on_focus_changed(self, old, now):
+        if self.isVisible() and now is not None and not self.isAncestorOf(now):
+            self.hide()
 
-        scroll.setWidget(container)
+    def _on_clicked(self, model_index):
+        self.icon_selected.emit(self._row, model_index.row())
         self.hide()
 
     def eventFilter(self, obj, event):
-        # App-level filter: dismiss icon picker when clicking outside it
+        # Window filter: dismiss icon picker when clicking outside it
         if event.type() == QEvent.MouseButtonPress and self.isVisible():
             # Let the anchor widget handle its own toggle
             if obj is self._anchor:
                 return False
-            if not isinstance(obj, QLabel) or obj.property("icon_index") is None:
-                click_pos = event.globalPosition().toPoint()
-                picker_rect = QRect(self.mapToGlobal(QPoint(0, 0)), self.size())
-                if not picker_rect.contains(click_pos):
-                    self.hide()
-                    return False
-        # Grid icon clicks
-        if event.type() == QEvent.MouseButtonRelease and isinstance(obj, QLabel):
-            idx = obj.property("icon_index")
-            if idx is not None:
-                self.icon_selected.emit(idx)
+            click_pos = event.globalPosition().toPoint()
+            picker_rect = QRect(self.mapToGlobal(QPoint(0, 0)), self.size())
+            if not picker_rect.contains(click_pos):
                 self.hide()
-                return True
         return False
 
-    def show_at(self, anchor_widget):
+    def show_at(self, anchor_widget, row=None):
         self._anchor = anchor_widget
+        self._row = row
         top = anchor_widget.window()
         if self.parentWidget() is not top:
             self.setParent(top)
@@ -307,31 +455,45 @@ class IconPickerPopup(QFrame):
         self.move(pos)
         self.raise_()
         self.show()
-        if not self._filter_installed:
-            QApplication.instance().installEventFilter(self)
-            self._filter_installed = True
+        if self._filter_target is None:
+            top.installEventFilter(self)
+            self._filter_target = top
+
+    def is_open_for(self, row):
+        return self.isVisible() and self._row is row
 
     def hide(self):
-        if self._filter_installed:
-            QApplication.instance().removeEventFilter(self)
-            self._filter_installed = False
+        if self._filter_target is not None:
+            try:
+                self._filter_target.removeEventFilter(self)
+            except RuntimeError:
+                pass  # Window already destroyed (shutdown with popup open)
+            self._filter_target = None
         super().hide()
 
 
 class SeedWordRow(QFrame):
     status_changed = Signal()
+    resolved_changed = Signal(int)  # +1 / -1 when the row gains / loses a word
 
-    def __init__(self, position, parent=None):
+    def __init__(self, position, icon_picker, parent=None):
         super().__init__(parent)
         self.position = position
-        self.resolved_index = None
+        self._resolved_index = None
         self._block = False
+        self._last_search = None  # Text of the last completed resolve+search
+        self._popup_pos = None  # Cached popup anchor in window coordinates
+
+        # Coalesce bursts of keystrokes into a single resolve+search
+        self._text_timer = QTimer(self)
+        self._text_timer.setSingleShot(True)
+        self._text_timer.setInterval(60)
+        self._text_timer.timeout.connect(self._do_search)
 
         self.popup = SuggestionPopup()
         self.popup.word_selected.connect(self._on_word_selected)
 
-        self.icon_picker = IconPickerPopup()
-        self.icon_picker.icon_selected.connect(self._on_icon_selected)
+        self.icon_picker = icon_picker  # Shared with the other rows
 
         self.setFixedHeight(52)
         self.setStyleSheet(self._style_default())
@@ -385,25 +547,28 @@ class SeedWordRow(QFrame):
         # Icon label click → open icon picker
         if obj is self.icon_label:
             if event.type() == QEvent.MouseButtonPress:
-                if self.icon_picker.isVisible():
+                if self.icon_picker.is_open_for(self):
                     self.icon_picker.hide()
                 else:
                     self.popup.hide()
-                    self.icon_picker.show_at(self.icon_label)
+                    self.icon_picker.show_at(self.icon_label, self)
                 return True
             return False
 
         if obj is self.input and event.type() == QEvent.FocusIn:
-            print(f"  [row{self.position}.eventFilter] FocusIn")
+            if DEBUG_TIMING:
+                print(f"  [row{self.position}.eventFilter] FocusIn")
             self.icon_picker.hide()
             return False
 
         if obj is self.input and event.type() == QEvent.FocusOut:
             reason = event.reason()
-            print(f"  [row{self.position}.eventFilter] FocusOut reason={reason.name}")
+            if DEBUG_TIMING:
+                print(f"  [row{self.position}.eventFilter] FocusOut reason={reason.name}")
             if reason == Qt.MouseFocusReason:
                 # Delay hide — the click might be landing on the popup
-                print(f"    -> delaying hide 150ms (mouse click may be targeting popup)")
+                if DEBUG_TIMING:
+                    print(f"    -> delaying hide 150ms (mouse click may be targeting popup)")
                 QTimer.singleShot(150, self._deferred_popup_hide)
             else:
                 self.popup.hide()
@@ -412,6 +577,8 @@ class SeedWordRow(QFrame):
         if obj is not self.input or event.type() != QEvent.KeyPress:
             return False
         key = event.key()
+        if key in (Qt.Key_Down, Qt.Key_Up, Qt.Key_Return, Qt.Key_Enter, Qt.Key_Tab):
+            self._flush_search()
         if key == Qt.Key_Escape:
             if self.popup.isVisible():
                 self.popup.hide()
@@ -420,15 +587,15 @@ class SeedWordRow(QFrame):
                 self.icon_picker.hide()
                 return True
         if key == Qt.Key_Down:
-            if self.popup.isVisible() and self.popup.count():
+            if self.popup.isVisible() and self.popup.visible_count:
                 cur = self.popup.currentRow()
-                self.popup.setCurrentRow(min(cur + 1, self.popup.count() - 1))
+                self.popup.setCurrentRow(min(cur + 1, self.popup.visible_count - 1))
                 return True
             self.popup.hide()
             self._focus_next_row()
             return True
         if key == Qt.Key_Up:
-            if self.popup.isVisible() and self.popup.count():
+            if self.popup.isVisible() and self.popup.visible_count:
                 cur = self.popup.currentRow()
                 self.popup.setCurrentRow(max(cur - 1, 0))
                 return True
@@ -436,10 +603,10 @@ class SeedWordRow(QFrame):
             self._focus_prev_row()
             return True
         if key in (Qt.Key_Return, Qt.Key_Enter):
-            if self.popup.isVisible() and self.popup.count():
+            if self.popup.isVisible() and self.popup.visible_count:
                 # Select highlighted item, or first item if none highlighted
                 item = self.popup.currentItem() or self.popup.item(0)
-                word = item.data(Qt.UserRole) if item else None
+                word = self.popup.word_for(item)
                 if word:
                     self.popup.hide()
                     self._on_word_selected(word)
@@ -452,10 +619,10 @@ class SeedWordRow(QFrame):
                 return True
             return True
         if key == Qt.Key_Tab:
-            if self.popup.isVisible() and self.popup.count():
+            if self.popup.isVisible() and self.popup.visible_count:
                 # Select highlighted item, or first item if none highlighted
                 item = self.popup.currentItem() or self.popup.item(0)
-                word = item.data(Qt.UserRole) if item else None
+                word = self.popup.word_for(item)
                 if word:
                     self.popup.hide()
                     self._on_word_selected(word)
@@ -467,43 +634,50 @@ class SeedWordRow(QFrame):
             return True
         return False
 
+    @property
+    def resolved_index(self):
+        return self._resolved_index
+
+    @resolved_index.setter
+    def resolved_index(self, idx):
+        was_resolved = self._resolved_index is not None
+        self._resolved_index = idx
+        if was_resolved != (idx is not None):
+            self.resolved_changed.emit(-1 if was_resolved else 1)
+
     def _deferred_popup_hide(self):
         """Hide popup after a short delay — only if input no longer has focus."""
         if not self.input.hasFocus():
-            print(f"  [row{self.position}._deferred_popup_hide] input lost focus, hiding popup")
+            if DEBUG_TIMING:
+                print(f"  [row{self.position}._deferred_popup_hide] input lost focus, hiding popup")
             self.popup.hide()
-        else:
+        elif DEBUG_TIMING:
             print(f"  [row{self.position}._deferred_popup_hide] input still focused, keeping popup")
 
     def _focus_next_row(self):
         """Move focus to the next visible row's input field."""
-        parent = self.parent()
-        if parent is None:
-            return
-        rows = parent.findChildren(SeedWordRow)
-        rows.sort(key=lambda r: r.position)
-        for i, r in enumerate(rows):
-            if r is self:
-                for j in range(i + 1, len(rows)):
-                    if rows[j].isVisible():
-                        rows[j].input.setFocus()
-                        return
-                return
+        self.window().focus_next(self)
 
     def _focus_prev_row(self):
         """Move focus to the previous visible row's input field."""
-        parent = self.parent()
-        if parent is None:
-            return
-        rows = parent.findChildren(SeedWordRow)
-        rows.sort(key=lambda r: r.position)
-        for i, r in enumerate(rows):
-            if r is self:
-                for j in range(i - 1, -1, -1):
-                    if rows[j].isVisible():
-                        rows[j].input.setFocus()
-                        return
-                return
+        self.window().focus_prev(self)
+
+    # ── popup anchor cache ───────────────────────────────────
+    def popup_pos(self):
+        """Window position just below the input; recomputed after move/resize/scroll."""
+        if self._popup_pos is None:
+            self._popup_pos = self.input.mapTo(
+                self.window(), QPoint(0, self.input.height() + 4)
+            )
+        return self._popup_pos
+
+    def moveEvent(self, event):
+        self._popup_pos = None
+        super().moveEvent(event)
+
+    def resizeEvent(self, event):
+        self._popup_pos = None
+        super().resizeEvent(event)
 
     # ── styles ───────────────────────────────────────────────
     def _style_default(self):
@@ -522,25 +696,28 @@ class SeedWordRow(QFrame):
     def _show_placeholder(self):
         self.icon_label.setPixmap(QPixmap())
         self.icon_label.setText("")
-        self.icon_label.setStyleSheet(
+        set_style_sheet(
+            self.icon_label,
             "QLabel { background: #f0f0f5; border: 1px solid #e4e4ec; border-radius: 8px; }"
             "QLabel:hover { background: #e4e4f0; border-color: #c8c8d8; }"
         )
 
     def _show_icon(self, idx):
-        pm = load_icon(idx, ICON_SIZE)
+        pm = load_rounded(idx, ICON_SIZE, 8)
         if pm:
-            self.icon_label.setPixmap(rounded_pixmap(pm, 8))
-            self.icon_label.setStyleSheet(
+            self.icon_label.setPixmap(pm)
+            set_style_sheet(
+                self.icon_label,
                 "QLabel { background: #f0faf5; border: 1px solid #b0dcc0; border-radius: 8px; }"
                 "QLabel:hover { background: #e0f0ea; border-color: #90c8a8; }"
             )
 
     def _show_icon_preview(self, idx):
-        pm = load_icon(idx, ICON_SIZE)
+        pm = load_rounded(idx, ICON_SIZE, 8)
         if pm:
-            self.icon_label.setPixmap(rounded_pixmap(pm, 8))
-            self.icon_label.setStyleSheet(
+            self.icon_label.setPixmap(pm)
+            set_style_sheet(
+                self.icon_label,
                 "QLabel { background: #f8f8fc; border: 1px solid #d0d0e0; border-radius: 8px; }"
                 "QLabel:hover { background: #e4e4f0; border-color: #c8c8d8; }"
             )
@@ -551,39 +728,59 @@ class SeedWordRow(QFrame):
         if idx is not None:
             self.resolved_index = idx
             self._show_icon(idx)
-            _, base = BASE_LOOKUP.get(idx, ("?", "?"))
+            base = _BASE_WORD[idx]
             self.status_label.setText(base)
-            self.status_label.setStyleSheet(
+            set_style_sheet(
+                self.status_label,
                 "color: #2a9a5a; font-size: 11px; font-weight: 600; border: none; background: none;"
             )
-            self.setStyleSheet(self._style_match())
+            set_style_sheet(self, self._style_match())
         else:
             self.resolved_index = None
             self._show_placeholder()
             self.status_label.setText("")
-            self.status_label.setStyleSheet(
+            set_style_sheet(
+                self.status_label,
                 "color: #9898a8; font-size: 11px; border: none; background: none;"
             )
-            self.setStyleSheet(self._style_default())
+            set_style_sheet(self, self._style_default())
         self.status_changed.emit()
         return idx
 
     def _on_text(self, raw):
         if self._block:
+            # Programmatic update — drop any pending search for the old text
+            self._text_timer.stop()
+            self._last_search = None
             return
-        t_start = time.perf_counter()
-        text = raw.strip()
-        if not text:
+        if not raw.strip():
+            self._text_timer.stop()
+            self._last_search = None
             self.resolved_index = None
             self._show_placeholder()
             self.status_label.setText("")
-            self.status_label.setStyleSheet(
+            set_style_sheet(
+                self.status_label,
                 "color: #9898a8; font-size: 11px; border: none; background: none;"
             )
-            self.setStyleSheet(self._style_default())
+            set_style_sheet(self, self._style_default())
             self.popup.hide()
             self.status_changed.emit()
             return
+        self._text_timer.start()
+
+    def _flush_search(self):
+        """Run a pending debounced search now (before Tab/Enter act on it)."""
+        if self._text_timer.isActive():
+            self._text_timer.stop()
+            self._do_search()
+
+    def _do_search(self):
+        t_start = time.perf_counter()
+        text = self.input.text().strip()
+        if not text or text == self._last_search:
+            return
+        self._last_search = text
 
         t0 = time.perf_counter()
         idx = self._resolve_and_display(text)
@@ -597,7 +794,7 @@ class SeedWordRow(QFrame):
         if len(results) == 1 and results[0][0] == text.lower():
             self.popup.hide()
         elif results:
-            self.popup.show_for(results, self.input)
+            self.popup.show_for(results, self.input, self.popup_pos())
         else:
             self.popup.hide()
         t3 = time.perf_counter()
@@ -606,25 +803,29 @@ class SeedWordRow(QFrame):
         if idx is None and results:
             preview_idx = results[0][1]
             self._show_icon_preview(preview_idx)
-            _, base = BASE_LOOKUP.get(preview_idx, ("?", "?"))
+            base = _BASE_WORD[preview_idx]
             self.status_label.setText(base)
-            self.status_label.setStyleSheet(
+            set_style_sheet(
+                self.status_label,
                 "color: #9898a8; font-size: 11px; font-style: italic;"
                 " border: none; background: none;"
             )
         t_end = time.perf_counter()
-        print(f"[row{self.position}._on_text] '{text}' resolve={(t1-t0)*1000:.2f}ms search={(t2-t1)*1000:.2f}ms popup={(t3-t2)*1000:.2f}ms total={(t_end-t_start)*1000:.2f}ms")
+        if DEBUG_TIMING:
+            print(f"[row{self.position}._do_search] '{text}' resolve={(t1-t0)*1000:.2f}ms search={(t2-t1)*1000:.2f}ms popup={(t3-t2)*1000:.2f}ms total={(t_end-t_start)*1000:.2f}ms")
 
     def _on_word_selected(self, word):
         t0 = time.perf_counter()
-        print(f"  [row{self.position}._on_word_selected] word='{word}'")
+        if DEBUG_TIMING:
+            print(f"  [row{self.position}._on_word_selected] word='{word}'")
         self._block = True
         self.input.setText(word)
         self._block = False
         self._resolve_and_display(word)
         self.popup.hide()
         self.input.setFocus()
-        print(f"  [row{self.position}._on_word_selected] done  ({(time.perf_counter()-t0)*1000:.2f}ms)")
+        if DEBUG_TIMING:
+            print(f"  [row{self.position}._on_word_selected] done  ({(time.perf_counter()-t0)*1000:.2f}ms)")
 
     def clear(self):
         """Reset this row to its empty state."""
@@ -634,55 +835,197 @@ class SeedWordRow(QFrame):
         self.resolved_index = None
         self._show_placeholder()
         self.status_label.setText("")
-        self.status_label.setStyleSheet(
+        set_style_sheet(
+            self.status_label,
             "color: #9898a8; font-size: 11px; border: none; background: none;"
         )
-        self.setStyleSheet(self._style_default())
+        set_style_sheet(self, self._style_default())
         self.popup.hide()
         self.icon_picker.hide()
         self.status_changed.emit()
 
     def _on_icon_selected(self, idx):
         """Called when an icon is picked from the icon picker grid."""
-        _, base = BASE_LOOKUP.get(idx, ("?", "?"))
+        base = _BASE_WORD[idx]
         self._block = True
         self.input.setText(base)
         self._block = False
         self.resolved_index = idx
         self._show_icon(idx)
         self.status_label.setText(base)
-        self.status_label.setStyleSheet(
+        set_style_sheet(
+            self.status_label,
             "color: #2a9a5a; font-size: 11px; font-weight: 600; border: none; background: none;"
         )
-        self.setStyleSheet(self._style_match())
+        set_style_sheet(self, self._style_match())
         self.status_changed.emit()
         self.input.setFocus()
 
 
-TOGGLE_ACTIVE = (
-    "QPushButton { background: #2c2c3a; color: #ffffff; border: none;"
-    " border-radius: 10px; font-size: 12px; font-weight: 600; padding: 4px 14px; }"
-)
-TOGGLE_INACTIVE = (
+TOGGLE_BTN = (
     "QPushButton { background: #e8e8f0; color: #6a6a80; border: none;"
     " border-radius: 10px; font-size: 12px; font-weight: 500; padding: 4px 14px; }"
     "QPushButton:hover { background: #dcdce8; }"
+    "QPushButton[active=\"true\"] { background: #2c2c3a; color: #ffffff; font-weight: 600; }"
 )
 GENERATE_BTN = (
     "QPushButton { background: #2a9a5a; color: #ffffff; border: none;"
     " border-radius: 10px; font-size: 13px; font-weight: 600; padding: 6px 20px; }"
     "QPushButton:hover { background: #23884e; }"
     "QPushButton:pressed { background: #1d7542; }"
+    "QPushButton:disabled { background: #8fcaa8; }"
 )
 SMALL_BTN = (
     "QPushButton { background: #e8e8f0; color: #6a6a80; border: none;"
     " border-radius: 10px; font-size: 11px; font-weight: 500; padding: 4px 10px; }"
     "QPushButton:hover { background: #dcdce8; }"
 )
+# Appended to copy buttons; toggled by _flash_copied via the "copied" property
+COPIED_BTN = (
+    "QPushButton[copied=\"true\"] { background: #d0f0d8; color: #2a9a5a;"
+    " border-radius: 8px; font-size: 11px; font-weight: 600; }"
+    "QPushButton[copied=\"true\"]:hover { background: #c0e8cc; }"
+)
+KEY_LABEL = (
+    "QLabel { color: #9898a8; font-size: 10px; font-family: monospace;"
+    " background: none; padding: 2px 0; }"
+    "QLabel[state=\"ready\"] { color: #6a6a80; }"
+)
+
+# Status bar and mouse panel: every look is a dynamic-property state, so
+# updates re-polish one widget instead of re-parsing a fresh stylesheet
+STATUS_STYLE = """
+#statusFrame { background: #ffffff; border: 1px solid #e4e4ec; border-radius: 10px; }
+#statusFrame[state="complete"] { background: #f0faf5; border-color: #b0dcc0; }
+#statusFrame[state="error"] { background: #fdf0ef; border-color: #e0b0b0; }
+#statusCount {
+    color: #9898a8; font-size: 14px; font-weight: 600; border: none; background: none;
+}
+#statusCount[state="partial"] { color: #5a5a70; }
+#statusCount[state="complete"] { color: #2a9a5a; font-weight: 700; }
+#statusCount[state="error"] { color: #c0392b; font-weight: 700; }
+#statusHint { color: #b0b0c0; font-size: 12px; border: none; background: none; }
+#statusHint[state="complete"] { color: #2a9a5a; font-weight: 600; }
+#statusHint[state="error"] { color: #c0392b; font-weight: 600; }
+#statusBits {
+    color: #b0b0c0; font-size: 11px; font-weight: 600; border: none; background: none;
+}
+#statusBits[state="complete"] { color: #2a9a5a; }
+#statusFingerprint {
+    color: #b0b0c0; font-size: 15px; font-weight: 700;
+    font-family: monospace; letter-spacing: 3px; border: none; background: none;
+}
+#statusFingerprint[state="complete"] { color: #2a9a5a; }
+#statusFingerprint[state="error"] { color: #c0392b; }
+"""
+
+MOUSE_STYLE = """
+#mouseFrame { background: #fef0ef; border: 1px solid #e8b0a8; border-radius: 10px; }
+#mouseFrame[level="mid"] { background: #fff8f0; border-color: #e8c090; }
+#mouseFrame[level="high"] { background: #fdfdf0; border-color: #d8d8a0; }
+#mouseFrame[level="full"] { background: #f0faf5; border-color: #b0dcc0; }
+#mouseLabel { color: #c04030; font-size: 12px; border: none; background: none; }
+#mouseLabel[level="mid"] { color: #b08030; }
+#mouseLabel[level="high"] { color: #908a10; }
+#mouseLabel[level="full"] { color: #2a8a4a; }
+#mouseLabel[mode="active"] { font-weight: 500; }
+#mouseLabel[mode="done"] { font-weight: 600; }
+#mouseProgress { background: #e8e8f0; border: none; border-radius: 1px; }
+#mouseProgress::chunk { background: #e85040; border-radius: 1px; }
+#mouseProgress[level="mid"]::chunk { background: #e8a040; }
+#mouseProgress[level="high"]::chunk { background: #c0c020; }
+#mouseProgress[level="full"]::chunk { background: #2a9a5a; }
+#mouseButton {
+    background: #e8e8f0; color: #6a6a80; border: none;
+    border-radius: 8px; font-size: 11px; font-weight: 500;
+}
+#mouseButton:hover { background: #dcdce8; }
+#mouseButton[collecting="true"] { background: #e8524a; color: #ffffff; font-weight: 600; }
+#mouseButton[collecting="true"]:hover { background: #d4443c; }
+"""
+
+
+def set_style_sheet(widget, sheet):
+    """setStyleSheet, skipped when the sheet is unchanged (Qt re-polishes anyway)."""
+    if widget.styleSheet() != sheet:
+        widget.setStyleSheet(sheet)
+
+
+def set_style_state(widget, name, value):
+    """Set a QSS dynamic property, re-polishing the widget only if it changed."""
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
+def _derive_key(indexes, passphrase, version, ready):
+    """Key derivation for a daemon thread; the result goes back through a queued signal.
+
+    Not a pooled QRunnable: the pure-Python Argon2 fallback takes minutes and
+    can't be cancelled, and app teardown would wait for a pool job to finish.
+    """
+    import hashlib
+    key_bytes = get_seed(indexes, passphrase)
+    fp = hashlib.sha256(key_bytes).hexdigest()[:8].upper()
+    key_hex = key_bytes.hex()
+    short_hex = f"{key_hex[:16]}...{key_hex[-16:]}"  # Display form, built here
+    ready.emit(version, key_hex, short_hex, fp)
+
+
+class _GenerateJob(QRunnable):
+    """Pooled seed generation (entropy collection + mixing) off the GUI thread."""
+
+    def __init__(self, word_count, extra_entropy, language, version, ready):
+        super().__init__()
+        self.word_count = word_count
+        self.extra_entropy = extra_entropy
+        self.language = language
+        self.version = version
+        self.ready = ready
+
+    def run(self):
+        seed = generate_words(self.word_count, extra_entropy=self.extra_entropy,
+                              language=self.language)
+        self.ready.emit(self.version, list(seed))
+
+
+class _RandomnessJob(QRunnable):
+    """Pooled verify_randomness run for the randomness window."""
+
+    def __init__(self, ready):
+        super().__init__()
+        self.ready = ready
+
+    def run(self):
+        self.ready.emit(verify_randomness(num_samples=3, sample_size=1024))
+
+
+class _MouseMoveFilter(QObject):
+    """Pass-through app filter that reports cursor moves while installed.
+
+    Only QWindow objects are checked: they receive every move from the
+    platform, whereas widgets only see moves with mouse tracking enabled.
+    """
+
+    def __init__(self, callback, parent=None):
+        super().__init__(parent)
+        self._callback = callback
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.MouseMove and isinstance(obj, QWindow):
+            pos = event.globalPosition().toPoint()
+            self._callback(pos.x(), pos.y())
+        return False
 
 
 class SeedTestWindow(QMainWindow):
-    _key_ready = Signal(str, str)  # (key_hex, fingerprint)
+    _key_ready = Signal(int, str, str, str)  # (version, key_hex, short_hex, fingerprint)
+    _icons_ready = Signal(list)  # [((index, size), QImage | None), ...]
+    _seed_ready = Signal(int, list)  # (version, [(index, word), ...])
+    KEY_CACHE_SIZE = 8  # Recently derived keys kept for instant redisplay
 
     def __init__(self):
         super().__init__()
@@ -693,16 +1036,28 @@ class SeedTestWindow(QMainWindow):
         self.word_count = 36
         self._base_indexes = None  # Original indexes before passphrase transform
         self._key_version = 0  # Tracks async key derivation freshness
-        self._key_deriving = False  # True while a thread is running
+        self._key_deriving = False  # True while a derivation job is running
+        self._key_pending = False  # A newer derivation waits for the running one
+        self._key_cache = {}  # (indexes, passphrase) -> (key_hex, short_hex, fingerprint)
         self._full_key_hex = ""  # Full derived key hex for copy
         self._master_key_bytes = None  # Raw master key for profile derivation
         self._full_profile_key_hex = ""  # Full profile key hex for copy
         self._key_ready.connect(self._on_key_ready)
+        self._seed_version = 0  # Latest Generate request; older results are dropped
+        self._resolved_count = 0  # Resolved rows among the active word_count rows
+        self._seed_ready.connect(self._on_seed_ready)
         self._key_timer = QTimer()
         self._key_timer.setSingleShot(True)
         self._key_timer.setInterval(400)
         self._key_timer.timeout.connect(self._start_key_derivation)
 
+        # Decode + scale all icons in the background; pixmaps are made on
+        # the GUI thread when the images arrive (load_icon stays lazy until then)
+        self._icons_ready.connect(store_icon_images)
+        threading.Thread(
+            target=lambda: self._icons_ready.emit(_load_icon_images()), daemon=True
+        ).start()
+
         central = QWidget()
         central.setStyleSheet("background: #f5f5f7;")
         self.setCentralWidget(central)
@@ -735,10 +1090,9 @@ class SeedTestWindow(QMainWindow):
         self._collecting_mouse = False
 
         mouse_frame = QFrame()
+        mouse_frame.setObjectName("mouseFrame")
         mouse_frame.setFixedHeight(54)
-        mouse_frame.setStyleSheet(
-            "QFrame { background: #fef0ef; border: 1px solid #e8b0a8; border-radius: 10px; }"
-        )
+        mouse_frame.setStyleSheet(MOUSE_STYLE)
         mouse_vlay = QVBoxLayout(mouse_frame)
         mouse_vlay.setContentsMargins(16, 8, 16, 8)
         mouse_vlay.setSpacing(6)
@@ -752,9 +1106,7 @@ class SeedTestWindow(QMainWindow):
         mouse_row.addWidget(mouse_icon)
 
         self.mouse_label = QLabel("Collect mouse movement (increases randomness)")
-        self.mouse_label.setStyleSheet(
-            "color: #c04030; font-size: 12px; border: none; background: none;"
-        )
+        self.mouse_label.setObjectName("mouseLabel")
         mouse_row.addWidget(self.mouse_label, 1)
 
         self.mouse_clear_btn = QPushButton("Clear")
@@ -769,13 +1121,9 @@ class SeedTestWindow(QMainWindow):
         mouse_row.addWidget(self.mouse_clear_btn)
 
         self.mouse_btn = QPushButton("Collect")
+        self.mouse_btn.setObjectName("mouseButton")
         self.mouse_btn.setFixedSize(70, 24)
         self.mouse_btn.setCursor(Qt.PointingHandCursor)
-        self.mouse_btn.setStyleSheet(
-            "QPushButton { background: #e8e8f0; color: #6a6a80; border: none;"
-            " border-radius: 8px; font-size: 11px; font-weight: 500; }"
-            "QPushButton:hover { background: #dcdce8; }"
-        )
         self.mouse_btn.clicked.connect(self._toggle_mouse_collection)
         mouse_row.addWidget(self.mouse_btn)
 
@@ -786,15 +1134,14 @@ class SeedTestWindow(QMainWindow):
         self.mouse_progress.setRange(0, 256)
         self.mouse_progress.setValue(0)
         self.mouse_progress.setTextVisible(False)
-        self.mouse_progress.setStyleSheet(
-            "QProgressBar { background: #e8e8f0; border: none; border-radius: 1px; }"
-            "QProgressBar::chunk { background: #e85040; border-radius: 1px; }"
-        )
+        self.mouse_progress.setObjectName("mouseProgress")
         mouse_vlay.addWidget(self.mouse_progress)
 
-        self._mouse_timer = QTimer()
-        self._mouse_timer.setInterval(16)
-        self._mouse_timer.timeout.connect(self._poll_mouse)
+        self._mouse_filter = _MouseMoveFilter(self._on_mouse_move, self)
+        # Moves outside our windows produce no events — sample those slowly
+        self._mouse_poll_timer = QTimer()
+        self._mouse_poll_timer.setInterval(100)
+        self._mouse_poll_timer.timeout.connect(self._poll_outside_mouse)
 
         self.mouse_frame = mouse_frame
         main_layout.addSpacing(4)
@@ -809,14 +1156,15 @@ class SeedTestWindow(QMainWindow):
         self.btn_24 = QPushButton("24 words")
         self.btn_24.setFixedHeight(28)
         self.btn_24.setCursor(Qt.PointingHandCursor)
-        self.btn_24.setStyleSheet(TOGGLE_INACTIVE)
+        self.btn_24.setStyleSheet(TOGGLE_BTN)
         self.btn_24.clicked.connect(lambda: self._set_word_count(24))
         controls.addWidget(self.btn_24)
 
         self.btn_36 = QPushButton("36 words")
         self.btn_36.setFixedHeight(28)
         self.btn_36.setCursor(Qt.PointingHandCursor)
-        self.btn_36.setStyleSheet(TOGGLE_ACTIVE)
+        self.btn_36.setProperty("active", True)
+        self.btn_36.setStyleSheet(TOGGLE_BTN)
         self.btn_36.clicked.connect(lambda: self._set_word_count(36))
         controls.addWidget(self.btn_36)
 
@@ -825,7 +1173,7 @@ class SeedTestWindow(QMainWindow):
         self.copy_btn = QPushButton("Copy")
         self.copy_btn.setFixedHeight(28)
         self.copy_btn.setCursor(Qt.PointingHandCursor)
-        self.copy_btn.setStyleSheet(SMALL_BTN)
+        self.copy_btn.setStyleSheet(SMALL_BTN + COPIED_BTN)
         self.copy_btn.clicked.connect(self._copy_seed)
         controls.addWidget(self.copy_btn)
 
@@ -883,15 +1231,31 @@ class SeedTestWindow(QMainWindow):
         rows_layout.setContentsMargins(0, 0, 4, 0)
         rows_layout.setSpacing(4)
 
+        # One icon picker shared by every row
+        self._icon_picker = IconPickerPopup()
+        self._icon_picker.icon_selected.connect(self._on_icon_picked)
+
+        # Row changes arrive in bursts (paste, generate) — coalesce them
+        # into one status refresh per frame
+        self._status_timer = QTimer()
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(16)
+        self._status_timer.timeout.connect(self._update_status)
+
         self.rows = []
         for i in range(36):
-            row = SeedWordRow(i)
-            row.status_changed.connect(self._update_status)
+            row = SeedWordRow(i, self._icon_picker)
+            row.status_changed.connect(self._status_timer.start)
+            row.resolved_changed.connect(
+                lambda delta, pos=i: self._on_row_resolved(pos, delta)
+            )
             rows_layout.addWidget(row)
             self.rows.append(row)
 
         rows_layout.addStretch()
         scroll.setWidget(container)
+        # Popups are positioned in window coordinates — close them on scroll
+        scroll.verticalScrollBar().valueChanged.connect(self._on_rows_scrolled)
 
         # Hide popups when app loses focus (minimize, alt+tab, etc.)
         QApplication.instance().applicationStateChanged.connect(self._on_app_state)
@@ -951,42 +1315,31 @@ class SeedTestWindow(QMainWindow):
 
         # Status bar
         self.status_frame = QFrame()
+        self.status_frame.setObjectName("statusFrame")
         self.status_frame.setFixedHeight(44)
-        self.status_frame.setStyleSheet(
-            "QFrame { background: #ffffff; border: 1px solid #e4e4ec; border-radius: 10px; }"
-        )
+        self.status_frame.setStyleSheet(STATUS_STYLE)
         sl = QHBoxLayout(self.status_frame)
         sl.setContentsMargins(16, 0, 16, 0)
 
         self.count_label = QLabel("0 / 36")
-        self.count_label.setStyleSheet(
-            "color: #9898a8; font-size: 14px; font-weight: 600; border: none; background: none;"
-        )
+        self.count_label.setObjectName("statusCount")
         sl.addWidget(self.count_label)
 
         self.hint_label = QLabel("words resolved")
-        self.hint_label.setStyleSheet(
-            "color: #b0b0c0; font-size: 12px; border: none; background: none;"
-        )
+        self.hint_label.setObjectName("statusHint")
         sl.addWidget(self.hint_label)
 
         # Bit-strength indicator (shown next to "seed complete")
         self.bits_label = QLabel("")
-        self.bits_label.setStyleSheet(
-            "color: #b0b0c0; font-size: 11px; font-weight: 600; border: none; background: none;"
-        )
+        self.bits_label.setObjectName("statusBits")
         sl.addWidget(self.bits_label)
 
         sl.addStretch()
 
         # Fingerprint — external checksum the user writes down alongside their seed
         self.fp_label = QLabel("")
+        self.fp_label.setObjectName("statusFingerprint")
         self.fp_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        self.fp_label.setStyleSheet(
-            "color: #b0b0c0; font-size: 15px; font-weight: 700;"
-            " font-family: monospace; letter-spacing: 3px;"
-            " border: none; background: none;"
-        )
         sl.addWidget(self.fp_label)
 
         main_layout.addSpacing(8)
@@ -1007,10 +1360,7 @@ class SeedTestWindow(QMainWindow):
         key_row.addWidget(self.key_prefix)
 
         self.key_label = QLabel("")
-        self.key_label.setStyleSheet(
-            "color: #9898a8; font-size: 10px; font-family: monospace;"
-            " background: none; padding: 2px 0;"
-        )
+        self.key_label.setStyleSheet(KEY_LABEL)
         self.key_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
         key_row.addWidget(self.key_label)
 
@@ -1020,7 +1370,7 @@ class SeedTestWindow(QMainWindow):
         self.key_copy_btn.setStyleSheet(
             "QPushButton { background: #e8e8f0; color: #6a6a80; border: none;"
             " border-radius: 6px; font-size: 9px; font-weight: 500; }"
-            "QPushButton:hover { background: #dcdce8; }"
+            "QPushButton:hover { background: #dcdce8; }" + COPIED_BTN
         )
         self.key_copy_btn.clicked.connect(self._copy_private_seed)
         self.key_copy_btn.hide()
@@ -1069,10 +1419,7 @@ class SeedTestWindow(QMainWindow):
         profile_row.addWidget(self.profile_toggle)
 
         self.profile_key_label = QLabel("")
-        self.profile_key_label.setStyleSheet(
-            "color: #9898a8; font-size: 10px; font-family: monospace;"
-            " background: none; padding: 2px 0;"
-        )
+        self.profile_key_label.setStyleSheet(KEY_LABEL)
         self.profile_key_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
         profile_row.addWidget(self.profile_key_label)
 
@@ -1082,7 +1429,7 @@ class SeedTestWindow(QMainWindow):
         self.profile_key_copy_btn.setStyleSheet(
             "QPushButton { background: #e8e8f0; color: #6a6a80; border: none;"
             " border-radius: 6px; font-size: 9px; font-weight: 500; }"
-            "QPushButton:hover { background: #dcdce8; }"
+            "QPushButton:hover { background: #dcdce8; }" + COPIED_BTN
         )
         self.profile_key_copy_btn.clicked.connect(self._copy_profile_key)
         self.profile_key_copy_btn.hide()
@@ -1113,25 +1460,27 @@ class SeedTestWindow(QMainWindow):
         main_layout.addLayout(bottom_row)
 
     def _open_randomness_dialog(self):
-        if hasattr(self, '_randomness_dialog') and self._randomness_dialog and self._randomness_dialog.isVisible():
-            self._randomness_dialog.raise_()
-            self._randomness_dialog.activateWindow()
+        dialog = getattr(self, '_randomness_dialog', None)
+        if dialog is not None and dialog.isVisible():
+            dialog.raise_()
+            dialog.activateWindow()
             return
-        self._randomness_dialog = RandomnessDialog()
+        if dialog is None:
+            # Built once; closing only hides it, later opens just re-run the tests
+            self._randomness_dialog = RandomnessDialog()
+        else:
+            dialog.reset()
         self._randomness_dialog.show()
 
     # ── copy / paste / clear ────────────────────────────────
     def _flash_copied(self, btn):
         """Temporarily show 'Copied!' feedback on a button."""
+        if btn.property("copied"):
+            return  # Already flashing — its restore is scheduled
         orig_text = btn.text()
-        orig_style = btn.styleSheet()
         btn.setText("Copied!")
-        btn.setStyleSheet(
-            "QPushButton { background: #d0f0d8; color: #2a9a5a; border: none;"
-            " border-radius: 8px; font-size: 11px; font-weight: 600; }"
-            "QPushButton:hover { background: #c0e8cc; }"
-        )
-        QTimer.singleShot(1200, lambda: (btn.setText(orig_text), btn.setStyleSheet(orig_style)))
+        set_style_state(btn, "copied", True)
+        QTimer.singleShot(1200, lambda: (btn.setText(orig_text), set_style_state(btn, "copied", False)))
 
     def _copy_seed(self):
         """Copy all visible resolved words to clipboard, space-separated."""
@@ -1155,16 +1504,8 @@ class SeedTestWindow(QMainWindow):
         text = QApplication.clipboard().text()
         if not text:
             return
-        import re
-        words = re.split(r"[\s,]+", text.strip())
-        words = [w for w in words if w]
-        n = min(len(words), self.word_count)
-        for i in range(n):
-            row = self.rows[i]
-            row._block = True
-            row.input.setText(words[i])
-            row._block = False
-            row._resolve_and_display(words[i])
+        words = text.translate(_PASTE_TRANS).split()
+        self._fill_rows(words[:self.word_count])
         # Clear passphrase so pasted words display as-is
         # (avoids double-transforming already-transformed words)
         self.passphrase_input.clear()
@@ -1178,10 +1519,39 @@ class SeedTestWindow(QMainWindow):
         self._update_status()
         self.rows[0].input.setFocus()
 
+    def _on_row_resolved(self, position, delta):
+        """Keep the resolved-row count for the active rows current."""
+        if position < self.word_count:
+            self._resolved_count += delta
+
+    def _recount_resolved(self):
+        self._resolved_count = sum(
+            1 for r in self.rows[:self.word_count] if r.resolved_index is not None
+        )
+
+    def _fill_rows(self, words):
+        """Put words into the leading rows as one batch (caller refreshes status)."""
+        rows = self.rows[:len(words)]
+        self.setUpdatesEnabled(False)
+        for row in rows:
+            row.blockSignals(True)  # No per-row status_changed
+        try:
+            for row, word in zip(rows, words):
+                row._block = True
+                row.input.setText(word)
+                row._block = False
+                row._resolve_and_display(word)
+        finally:
+            for row in rows:
+                row.blockSignals(False)
+            self.setUpdatesEnabled(True)
+            self._recount_resolved()  # Deltas were blocked with the signals
+
     def _clear_all(self):
         """Clear all rows and reset state."""
         self._base_indexes = None
         self._master_key_bytes = None
+        self._key_cache.clear()
         for row in self.rows:
             row.clear()
         self.passphrase_input.clear()
@@ -1202,9 +1572,7 @@ class SeedTestWindow(QMainWindow):
         """Called on every keystroke — updates entropy instantly, debounces key derivation."""
         pp = self.passphrase_input.text()
         # Instant: update entropy label (no widget churn)
-        active = self.rows[:self.word_count]
-        n = sum(1 for r in active if r.resolved_index is not None)
-        if n == self.word_count:
+        if self._resolved_count == self.word_count:
             bits = get_entropy_bits(self.word_count, pp)
             bits_str = f"{bits:.0f}-bit entropy" if bits == int(bits) else f"~{bits:.0f}-bit entropy"
             self.bits_label.setText(bits_str)
@@ -1216,28 +1584,24 @@ class SeedTestWindow(QMainWindow):
         self._update_status()
 
     # ── mouse entropy collection ─────────────────────────
-    def _mouse_style_for_count(self, count):
-        """Return (chunk_color, text_color, frame_bg, frame_border) based on count."""
+    def _mouse_level_for_count(self, count):
+        """Return the MOUSE_STYLE level ("low", "mid", "high", "full") for count."""
         if count >= 192:
-            return ("#2a9a5a", "#2a8a4a", "#f0faf5", "#b0dcc0")
+            return "full"
         elif count >= 128:
-            return ("#c0c020", "#908a10", "#fdfdf0", "#d8d8a0")
+            return "high"
         elif count >= 64:
-            return ("#e8a040", "#b08030", "#fff8f0", "#e8c090")
+            return "mid"
         else:
-            return ("#e85040", "#c04030", "#fef0ef", "#e8b0a8")
-
-    def _apply_mouse_style(self, count):
-        """Apply mouse entropy colors based on current count."""
-        chunk, text, frame_bg, frame_border = self._mouse_style_for_count(count)
-        self.mouse_progress.setStyleSheet(
-            f"QProgressBar {{ background: #e8e8f0; border: none; border-radius: 1px; }}"
-            f"QProgressBar::chunk {{ background: {chunk}; border-radius: 1px; }}"
-        )
-        self.mouse_frame.setStyleSheet(
-            f"QFrame {{ background: {frame_bg}; border: 1px solid {frame_border}; border-radius: 10px; }}"
-        )
-        return chunk, text, frame_bg, frame_border
+            return "low"
+
+    def _apply_mouse_style(self, count, mode=None):
+        """Apply mouse entropy colors for count; mode sets the label weight."""
+        level = self._mouse_level_for_count(count)
+        set_style_state(self.mouse_progress, "level", level)
+        set_style_state(self.mouse_frame, "level", level)
+        set_style_state(self.mouse_label, "level", level)
+        set_style_state(self.mouse_label, "mode", mode)
 
     def _clear_mouse(self):
         """Clear collected mouse entropy and reset UI."""
@@ -1245,9 +1609,6 @@ class SeedTestWindow(QMainWindow):
             self._stop_mouse_collection()
         self._mouse_pool.reset()
         self.mouse_label.setText("Collect mouse movement (increases randomness)")
-        self.mouse_label.setStyleSheet(
-            "color: #c04030; font-size: 12px; border: none; background: none;"
-        )
         self.mouse_progress.setValue(0)
         self._apply_mouse_style(0)
 
@@ -1261,64 +1622,47 @@ class SeedTestWindow(QMainWindow):
         self._collecting_mouse = True
         count = self._mouse_pool.sample_count
         self.mouse_btn.setText("Stop")
-        self.mouse_btn.setStyleSheet(
-            "QPushButton { background: #e8524a; color: #ffffff; border: none;"
-            " border-radius: 8px; font-size: 11px; font-weight: 600; }"
-            "QPushButton:hover { background: #d4443c; }"
-        )
+        set_style_state(self.mouse_btn, "collecting", True)
         if count > 0:
             self.mouse_label.setText(f"{count} movements — move your mouse around")
         else:
             self.mouse_label.setText("Move your mouse around")
-        _, text_color, _, _ = self._mouse_style_for_count(count)
-        self.mouse_label.setStyleSheet(
-            f"color: {text_color}; font-size: 12px; font-weight: 500;"
-            " border: none; background: none;"
-        )
         self.mouse_progress.setValue(min(count, 256))
-        self._apply_mouse_style(count)
-        # Poll global cursor position at ~60fps (works outside the window)
-        self._mouse_timer.start()
+        self._apply_mouse_style(count, "active")
+        # Sample real cursor moves over the app's windows (no idle wake-ups)
+        QApplication.instance().installEventFilter(self._mouse_filter)
+        self._mouse_poll_timer.start()
 
     def _stop_mouse_collection(self):
         self._collecting_mouse = False
-        self._mouse_timer.stop()
+        QApplication.instance().removeEventFilter(self._mouse_filter)
+        self._mouse_poll_timer.stop()
         count = self._mouse_pool.sample_count
         self.mouse_btn.setText("Collect")
-        self.mouse_btn.setStyleSheet(
-            "QPushButton { background: #e8e8f0; color: #6a6a80; border: none;"
-            " border-radius: 8px; font-size: 11px; font-weight: 500; }"
-            "QPushButton:hover { background: #dcdce8; }"
-        )
-        _, text_color, _, _ = self._mouse_style_for_count(count)
+        set_style_state(self.mouse_btn, "collecting", False)
         if count > 0:
             self.mouse_label.setText(f"{count} movements collected")
-            self.mouse_label.setStyleSheet(
-                f"color: {text_color}; font-size: 12px; font-weight: 600;"
-                " border: none; background: none;"
-            )
+            self._apply_mouse_style(count, "done")
         else:
             self.mouse_label.setText("Collect mouse movement (increases randomness)")
-            self.mouse_label.setStyleSheet(
-                f"color: {text_color}; font-size: 12px; border: none; background: none;"
-            )
-        self._apply_mouse_style(count)
+            self._apply_mouse_style(count)
 
-    def _poll_mouse(self):
-        """Poll global cursor position — works even outside the window."""
+    def _poll_outside_mouse(self):
+        """Sample the cursor while it is off our windows (10 Hz fallback)."""
         pos = QCursor.pos()
-        if not self._mouse_pool.add_sample(pos.x(), pos.y()):
+        if QApplication.widgetAt(pos) is None:
+            self._on_mouse_move(pos.x(), pos.y())
+
+    def _on_mouse_move(self, x, y):
+        """Feed one cursor move (global coordinates) into the entropy pool."""
+        if not self._mouse_pool.add_sample(x, y):
             return  # No movement — skip
         count = self._mouse_pool.sample_count
         self.mouse_label.setText(f"{count} movements collected")
         self.mouse_progress.setValue(min(count, 256))
         # Update colors at threshold crossings (64, 128, 192)
         if count in (64, 128, 192, 256):
-            _, text_color, _, _ = self._apply_mouse_style(count)
-            self.mouse_label.setStyleSheet(
-                f"color: {text_color}; font-size: 12px; font-weight: 500;"
-                " border: none; background: none;"
-            )
+            self._apply_mouse_style(count, "active")
 
     # ── word count toggle ─────────────────────────────────
     def _set_word_count(self, count):
@@ -1326,14 +1670,15 @@ class SeedTestWindow(QMainWindow):
             return
         self.word_count = count
         # Update toggle styles
-        self.btn_24.setStyleSheet(TOGGLE_ACTIVE if count == 24 else TOGGLE_INACTIVE)
-        self.btn_36.setStyleSheet(TOGGLE_ACTIVE if count == 36 else TOGGLE_INACTIVE)
+        set_style_state(self.btn_24, "active", count == 24)
+        set_style_state(self.btn_36, "active", count == 36)
         # Show/hide rows — keep data intact so switching back restores words
         for i, row in enumerate(self.rows):
             if i < count:
                 row.show()
             else:
                 row.hide()
+        self._recount_resolved()
         self._update_status()
 
     # ── language change ─────────────────────────────────────
@@ -1348,25 +1693,34 @@ class SeedTestWindow(QMainWindow):
         extra = self._mouse_pool.digest() if self._mouse_pool.sample_count > 0 else None
         lang_code = self.lang_combo.currentData()
         language = lang_code if lang_code != "english" else None
-        seed = list(generate_words(self.word_count, extra_entropy=extra, language=language))
+        self._seed_version += 1
+        self.generate_btn.setEnabled(False)  # Busy until _on_seed_ready
+        # Global pool is safe: key derivation runs on its own daemon thread
+        QThreadPool.globalInstance().start(
+            _GenerateJob(self.word_count, extra, language, self._seed_version, self._seed_ready)
+        )
+
+    def _on_seed_ready(self, version, seed):
+        """Show a generated seed (called from signal when the job finishes)."""
+        if version != self._seed_version:
+            return  # Superseded; the latest job re-enables Generate
+        self.generate_btn.setEnabled(True)
+        if len(seed) != self.word_count:
+            return  # The word count changed meanwhile
         self._base_indexes = [idx for idx, word in seed]
 
-        # Display the words (use translated word from seed, not BASE_LOOKUP)
-        for i, (idx, word) in enumerate(seed):
-            row = self.rows[i]
-            row._block = True
-            row.input.setText(word)
-            row._block = False
-            row._resolve_and_display(word)
+        # Display the words (use translated word from seed, not _BASE_WORD)
+        self._fill_rows([word for idx, word in seed])
         self._update_status()
         self.rows[0].input.setFocus()
 
     # ── status ────────────────────────────────────────────
     def _update_status(self):
+        self._status_timer.stop()  # Any queued row refresh is covered by this one
         active = self.rows[:self.word_count]
-        n = sum(1 for r in active if r.resolved_index is not None)
+        n = self._resolved_count
         total = self.word_count
-        self.count_label.setText(f"{n} / {total}")
+        self.count_label.setText(_COUNT_TEXT[n, total])
 
         if n == total:
             indexes = [r.resolved_index for r in active]
@@ -1375,91 +1729,42 @@ class SeedTestWindow(QMainWindow):
                 self._base_indexes = list(indexes)
             # Verify checksum before proceeding
             if not verify_checksum(indexes):
-                self.count_label.setStyleSheet(
-                    "color: #c0392b; font-size: 14px; font-weight: 700;"
-                    " border: none; background: none;"
-                )
+                self._drop_key_request()
+                self._set_status_state("error")
                 self.hint_label.setText("checksum failed")
-                self.hint_label.setStyleSheet(
-                    "color: #c0392b; font-size: 12px; font-weight: 600;"
-                    " border: none; background: none;"
-                )
                 self.bits_label.setText("")
                 self.fp_label.setText("--------")
-                self.fp_label.setStyleSheet(
-                    "color: #c0392b; font-size: 15px; font-weight: 700;"
-                    " font-family: monospace; letter-spacing: 3px;"
-                    " border: none; background: none;"
-                )
-                self.status_frame.setStyleSheet(
-                    "QFrame { background: #fdf0ef; border: 1px solid #e0b0b0;"
-                    " border-radius: 10px; }"
-                )
                 self.key_label.setText("")
                 self.profile_row_widget.hide()
                 return
             pp = self.passphrase_input.text()
             bits = get_entropy_bits(self.word_count, pp)
             bits_str = f"{bits:.0f}-bit entropy" if bits == int(bits) else f"~{bits:.0f}-bit entropy"
-            self.count_label.setStyleSheet(
-                "color: #2a9a5a; font-size: 14px; font-weight: 700;"
-                " border: none; background: none;"
-            )
+            self._set_status_state("complete")
             self.hint_label.setText("seed complete")
-            self.hint_label.setStyleSheet(
-                "color: #2a9a5a; font-size: 12px; font-weight: 600;"
-                " border: none; background: none;"
-            )
             self.bits_label.setText(bits_str)
-            self.bits_label.setStyleSheet(
-                "color: #2a9a5a; font-size: 11px; font-weight: 600;"
-                " border: none; background: none;"
-            )
             # Fingerprint computed in background via _derive_key → _on_key_ready
             self.fp_label.setText("--------")
-            self.fp_label.setStyleSheet(
-                "color: #2a9a5a; font-size: 15px; font-weight: 700;"
-                " font-family: monospace; letter-spacing: 3px;"
-                " border: none; background: none;"
-            )
-            self.status_frame.setStyleSheet(
-                "QFrame { background: #f0faf5; border: 1px solid #b0dcc0;"
-                " border-radius: 10px; }"
-            )
             # Schedule key derivation (debounced — avoids CPU flood on rapid clicks)
             self._key_version += 1
             self._key_indexes = list(indexes)
             self._key_passphrase = pp
+            cached = self._key_cache.get((tuple(indexes), pp))
+            if cached is not None:
+                # Already derived this session (e.g. passphrase typed back)
+                self._key_timer.stop()
+                self._key_pending = False
+                self._show_key(*cached)
+                return
             self.key_label.setText("deriving key...")
-            self.key_label.setStyleSheet(
-                "color: #9898a8; font-size: 10px; font-family: monospace;"
-                " background: none; padding: 2px 4px;"
-            )
+            set_style_state(self.key_label, "state", "pending")
             self._key_timer.start()
         else:
-            self.count_label.setStyleSheet(
-                f"color: {'#5a5a70' if n else '#9898a8'}; font-size: 14px; "
-                "font-weight: 600; border: none; background: none;"
-            )
+            self._drop_key_request()
+            self._set_status_state("partial" if n else "idle")
             self.hint_label.setText("words resolved")
-            self.hint_label.setStyleSheet(
-                "color: #b0b0c0; font-size: 12px; border: none; background: none;"
-            )
             self.bits_label.setText("")
-            self.bits_label.setStyleSheet(
-                "color: #b0b0c0; font-size: 11px; font-weight: 600;"
-                " border: none; background: none;"
-            )
             self.fp_label.setText("")
-            self.fp_label.setStyleSheet(
-                "color: #b0b0c0; font-size: 15px; font-weight: 700;"
-                " font-family: monospace; letter-spacing: 3px;"
-                " border: none; background: none;"
-            )
-            self.status_frame.setStyleSheet(
-                "QFrame { background: #ffffff; border: 1px solid #e4e4ec;"
-                " border-radius: 10px; }"
-            )
             self.key_label.setText("")
             self.key_prefix.hide()
             self.key_copy_btn.hide()
@@ -1470,35 +1775,58 @@ class SeedTestWindow(QMainWindow):
             self.profile_key_copy_btn.hide()
             self._full_profile_key_hex = ""
 
+    def _set_status_state(self, state):
+        """Switch the status bar between its STATUS_STYLE states."""
+        set_style_state(self.status_frame, "state", state)
+        set_style_state(self.count_label, "state", state)
+        set_style_state(self.hint_label, "state", state)
+        set_style_state(self.bits_label, "state", state)
+        set_style_state(self.fp_label, "state", state)
+
+    def _drop_key_request(self):
+        """Forget any scheduled derivation; a running one finishes as stale."""
+        self._key_version += 1
+        self._key_timer.stop()
+        self._key_pending = False
+
     def _start_key_derivation(self):
-        """Spawn one background thread for key derivation (debounced)."""
+        """Run one key derivation on a daemon thread (debounced)."""
         if self._key_deriving:
-            self._key_timer.start()  # retry after current one finishes
+            # The KDF can't be interrupted — run the latest request once it ends
+            self._key_pending = True
             return
         idxs = getattr(self, '_key_indexes', None)
         pp = getattr(self, '_key_passphrase', '')
         if idxs is None:
             return
         self._key_deriving = True
-        version = self._key_version
-        def _derive():
-            import hashlib
-            key_bytes = get_seed(idxs, pp)
-            fp2 = hashlib.sha256(key_bytes).hexdigest()[:8].upper()
-            self._key_deriving = False
-            if self._key_version == version:
-                self._key_ready.emit(key_bytes.hex(), fp2)
-        threading.Thread(target=_derive, daemon=True).start()
-
-    def _on_key_ready(self, key_hex, fp):
+        threading.Thread(
+            target=_derive_key, args=(idxs, pp, self._key_version, self._key_ready),
+            daemon=True,
+        ).start()
+
+    def _on_key_ready(self, version, key_hex, short_hex, fp):
         """Called from signal when background key derivation completes."""
+        self._key_deriving = False
+        if version != self._key_version:
+            # Seed or passphrase changed while deriving
+            if self._key_pending:
+                self._key_pending = False
+                self._start_key_derivation()
+            return
+        if len(self._key_cache) >= self.KEY_CACHE_SIZE:
+            self._key_cache.pop(next(iter(self._key_cache)))
+        self._key_cache[(tuple(self._key_indexes), self._key_passphrase)] = (
+            key_hex, short_hex, fp
+        )
+        self._show_key(key_hex, short_hex, fp)
+
+    def _show_key(self, key_hex, short_hex, fp):
+        """Display a derived master key and its fingerprint."""
         self._full_key_hex = key_hex
         self._master_key_bytes = bytes.fromhex(key_hex)
-        self.key_label.setText(f"{key_hex[:16]}...{key_hex[-16:]}")
-        self.key_label.setStyleSheet(
-            "color: #6a6a80; font-size: 10px; font-family: monospace;"
-            " background: none; padding: 2px 0;"
-        )
+        self.key_label.setText(short_hex)
+        set_style_state(self.key_label, "state", "ready")
         self.key_prefix.show()
         self.key_copy_btn.show()
         self.fp_label.setText(fp)
@@ -1530,10 +1858,7 @@ class SeedTestWindow(QMainWindow):
         self.profile_key_label.setText(
             f"{self._full_profile_key_hex[:16]}...{self._full_profile_key_hex[-16:]}"
         )
-        self.profile_key_label.setStyleSheet(
-            "color: #6a6a80; font-size: 10px; font-family: monospace;"
-            " background: none; padding: 2px 0;"
-        )
+        set_style_state(self.profile_key_label, "state", "ready")
         self.profile_key_copy_btn.show()
 
     def _copy_profile_key(self):
@@ -1541,11 +1866,36 @@ class SeedTestWindow(QMainWindow):
             QApplication.clipboard().setText(self._full_profile_key_hex)
             self._flash_copied(self.profile_key_copy_btn)
 
+    def focus_next(self, row):
+        """Focus the first visible row after `row` (self.rows is in position order)."""
+        for r in self.rows[row.position + 1:]:
+            if r.isVisible():
+                r.input.setFocus()
+                return
+
+    def focus_prev(self, row):
+        """Focus the last visible row before `row`."""
+        for r in reversed(self.rows[:row.position]):
+            if r.isVisible():
+                r.input.setFocus()
+                return
+
     def _hide_all_popups(self, reason="unknown"):
-        print(f"  [window._hide_all_popups] reason={reason}")
+        if DEBUG_TIMING:
+            print(f"  [window._hide_all_popups] reason={reason}")
         for row in self.rows:
             row.popup.hide()
-            row.icon_picker.hide()
+        self._icon_picker.hide()
+
+    def _on_rows_scrolled(self, _value):
+        # Scrolling moves rows relative to the window without a row moveEvent
+        for row in self.rows:
+            row._popup_pos = None
+        self._hide_all_popups(reason="scroll")
+
+    def _on_icon_picked(self, row, idx):
+        if row is not None:
+            row._on_icon_selected(idx)
 
     def _on_app_state(self, state):
         if state != Qt.ApplicationActive:
@@ -1565,22 +1915,35 @@ class SeedTestWindow(QMainWindow):
         super().moveEvent(event)
 
 
+# Whole-window sheet: results only flip "state" properties (pass / fail)
 RANDOMNESS_DIALOG_STYLE = """
 QDialog { background: #f5f5f7; }
-"""
-
-RANDOMNESS_TEST_LABEL = (
-    "color: #9898a8; font-size: 13px; font-weight: 500;"
-    " background: none; border: none;"
-)
-RANDOMNESS_TEST_PASS = (
-    "color: #2a9a5a; font-size: 13px; font-weight: 600;"
-    " background: none; border: none;"
-)
-RANDOMNESS_TEST_FAIL = (
-    "color: #d04040; font-size: 13px; font-weight: 600;"
-    " background: none; border: none;"
-)
+QLabel { background: none; border: none; }
+#randomnessTitle {
+    color: #1a1a2a; font-size: 18px; font-weight: 700; letter-spacing: 0.5px;
+}
+#randomnessSubtitle { color: #8888a0; font-size: 12px; }
+#randomnessProgress { background: #e8e8f0; border: none; border-radius: 3px; }
+#randomnessProgress::chunk { background: #2a9a5a; border-radius: 3px; }
+#randomnessProgress[state="fail"]::chunk { background: #d04040; }
+#randomnessStatus { color: #9898a8; font-size: 11px; }
+#randomnessStatus[state="pass"] { color: #2a9a5a; font-weight: 600; }
+#randomnessStatus[state="fail"] { color: #d04040; font-weight: 600; }
+#randomnessTests { background: #ffffff; border: 1px solid #e4e4ec; border-radius: 10px; }
+QLabel[role="test-name"], QLabel[role="test-status"] {
+    color: #9898a8; font-size: 13px; font-weight: 500;
+}
+QLabel[role="test-name"][state="pass"], QLabel[role="test-status"][state="pass"] {
+    color: #2a9a5a; font-weight: 600;
+}
+QLabel[role="test-name"][state="fail"], QLabel[role="test-status"][state="fail"] {
+    color: #d04040; font-weight: 600;
+}
+QLabel[role="test-desc"] { color: #b0b0c0; font-size: 10px; }
+#randomnessOverall { color: #9898a8; font-size: 14px; font-weight: 700; }
+#randomnessOverall[state="pass"] { color: #2a9a5a; }
+#randomnessOverall[state="fail"] { color: #d04040; }
+""" + GENERATE_BTN  # The dialog's only push button is "Continue"
 
 
 # Friendly display names for each test
@@ -1599,6 +1962,17 @@ _TEST_DESCRIPTIONS = {
     "autocorrelation": "Checks for correlations between bit positions",
 }
 
+# Pass/fail outcome -> (state property, status text, (mark glyph, mark color))
+_TEST_OUTCOME = {
+    True: ("pass", "PASS", ("\u2714", "#2a9a5a")),
+    False: ("fail", "FAIL", ("\u2718", "#d04040")),
+}
+# Overall outcome -> (state property, status line, verdict)
+_OVERALL_OUTCOME = {
+    True: ("pass", "All tests completed", "\u2714  Entropy source is healthy"),
+    False: ("fail", "Issues detected", "\u2718  Weak randomness detected!"),
+}
+
 
 class RandomnessDialog(QMainWindow):
     """Window that runs randomness verification with a progress bar."""
@@ -1618,38 +1992,31 @@ class RandomnessDialog(QMainWindow):
 
         # Title
         title = QLabel("Randomness Verification")
+        title.setObjectName("randomnessTitle")
         title.setAlignment(Qt.AlignCenter)
-        title.setStyleSheet(
-            "color: #1a1a2a; font-size: 18px; font-weight: 700;"
-            " letter-spacing: 0.5px; background: none; border: none;"
-        )
         layout.addWidget(title)
 
         subtitle = QLabel("Testing entropy source quality")
+        subtitle.setObjectName("randomnessSubtitle")
         subtitle.setAlignment(Qt.AlignCenter)
-        subtitle.setStyleSheet(
-            "color: #8888a0; font-size: 12px; background: none; border: none;"
-        )
         layout.addWidget(subtitle)
         layout.addSpacing(16)
 
         # Progress bar
         self.progress = QProgressBar()
+        self.progress.setObjectName("randomnessProgress")
         self.progress.setFixedHeight(6)
-        self.progress.setRange(0, 0)  # indeterminate
+        # Static until the result: a run takes a few ms, so a busy animation
+        # would only add repaints
+        self.progress.setRange(0, 100)
+        self.progress.setValue(0)
         self.progress.setTextVisible(False)
-        self.progress.setStyleSheet(
-            "QProgressBar { background: #e8e8f0; border: none; border-radius: 3px; }"
-            "QProgressBar::chunk { background: #2a9a5a; border-radius: 3px; }"
-        )
         layout.addWidget(self.progress)
         layout.addSpacing(6)
 
         self.status_label = QLabel("Collecting entropy samples...")
+        self.status_label.setObjectName("randomnessStatus")
         self.status_label.setAlignment(Qt.AlignCenter)
-        self.status_label.setStyleSheet(
-            "color: #9898a8; font-size: 11px; background: none; border: none;"
-        )
         layout.addWidget(self.status_label)
         layout.addSpacing(16)
 
@@ -1658,9 +2025,7 @@ class RandomnessDialog(QMainWindow):
         self._test_rows = {}
 
         tests_frame = QFrame()
-        tests_frame.setStyleSheet(
-            "QFrame { background: #ffffff; border: 1px solid #e4e4ec; border-radius: 10px; }"
-        )
+        tests_frame.setObjectName("randomnessTests")
         tests_layout = QVBoxLayout(tests_frame)
         tests_layout.setContentsMargins(16, 12, 16, 12)
         tests_layout.setSpacing(8)
@@ -1670,32 +2035,28 @@ class RandomnessDialog(QMainWindow):
             row.setSpacing(10)
 
             icon_label = QLabel("")
-            icon_label.setFixedWidth(24)
+            icon_label.setProperty("role", "test-icon")
+            icon_label.setFixedSize(24, 24)
             icon_label.setAlignment(Qt.AlignCenter)
-            icon_label.setStyleSheet(
-                "font-size: 14px; background: none; border: none;"
-            )
             row.addWidget(icon_label)
 
             name_col = QVBoxLayout()
             name_col.setSpacing(1)
 
             display_name = QLabel(_TEST_DISPLAY_NAMES.get(name, name))
-            display_name.setStyleSheet(RANDOMNESS_TEST_LABEL)
+            display_name.setProperty("role", "test-name")
             name_col.addWidget(display_name)
 
             desc = QLabel(_TEST_DESCRIPTIONS.get(name, ""))
-            desc.setStyleSheet(
-                "color: #b0b0c0; font-size: 10px; background: none; border: none;"
-            )
+            desc.setProperty("role", "test-desc")
             name_col.addWidget(desc)
 
             row.addLayout(name_col, 1)
 
             status_label = QLabel("")
+            status_label.setProperty("role", "test-status")
             status_label.setFixedWidth(50)
             status_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            status_label.setStyleSheet(RANDOMNESS_TEST_LABEL)
             row.addWidget(status_label)
 
             tests_layout.addLayout(row)
@@ -1706,11 +2067,8 @@ class RandomnessDialog(QMainWindow):
 
         # Overall result
         self.overall_label = QLabel("")
+        self.overall_label.setObjectName("randomnessOverall")
         self.overall_label.setAlignment(Qt.AlignCenter)
-        self.overall_label.setStyleSheet(
-            "color: #9898a8; font-size: 14px; font-weight: 700;"
-            " background: none; border: none;"
-        )
         layout.addWidget(self.overall_label)
 
         layout.addStretch()
@@ -1719,93 +2077,73 @@ class RandomnessDialog(QMainWindow):
         self.close_btn = QPushButton("Continue")
         self.close_btn.setFixedHeight(32)
         self.close_btn.setCursor(Qt.PointingHandCursor)
-        self.close_btn.setStyleSheet(GENERATE_BTN)
         self.close_btn.clicked.connect(self.close)
         self.close_btn.hide()
         layout.addWidget(self.close_btn)
 
         # Connect signal and start
+        self._running = False
         self._result_ready.connect(self._on_result)
-        QTimer.singleShot(100, self._start_test)
+        QTimer.singleShot(0, self._start_test)
+
+    def reset(self):
+        """Re-arm the window for another run (the widgets are reused)."""
+        if self._running:
+            return  # The run in progress will fill in the results
+        self.progress.setValue(0)
+        self.status_label.setText("Collecting entropy samples...")
+        for labels in self._test_rows.values():
+            for label in labels:
+                set_style_state(label, "state", None)
+            labels[0].clear()
+            labels[2].setText("")
+        self.overall_label.setText("")
+        self._set_overall_state(None)
+        self.close_btn.hide()
+        QTimer.singleShot(0, self._start_test)
+
+    def _set_overall_state(self, state):
+        """Color the progress bar, status line and verdict (RANDOMNESS_DIALOG_STYLE)."""
+        set_style_state(self.progress, "state", state)
+        set_style_state(self.status_label, "state", state)
+        set_style_state(self.overall_label, "state", state)
 
     def _start_test(self):
-        def _run():
-            result = verify_randomness(num_samples=3, sample_size=1024)
-            self._result_ready.emit(result)
-        threading.Thread(target=_run, daemon=True).start()
+        self._running = True
+        # Not queued behind key derivation: that runs on its own daemon thread
+        QThreadPool.globalInstance().start(_RandomnessJob(self._result_ready))
 
     def _on_result(self, result):
-        # Stop indeterminate progress
-        self.progress.setRange(0, 100)
-        self.progress.setValue(100)
-
-        all_pass = result["pass"]
-
-        if all_pass:
-            self.progress.setStyleSheet(
-                "QProgressBar { background: #e8e8f0; border: none; border-radius: 3px; }"
-                "QProgressBar::chunk { background: #2a9a5a; border-radius: 3px; }"
-            )
-            self.status_label.setText("All tests completed")
-            self.status_label.setStyleSheet(
-                "color: #2a9a5a; font-size: 11px; font-weight: 600;"
-                " background: none; border: none;"
-            )
-        else:
-            self.progress.setStyleSheet(
-                "QProgressBar { background: #e8e8f0; border: none; border-radius: 3px; }"
-                "QProgressBar::chunk { background: #d04040; border-radius: 3px; }"
-            )
-            self.status_label.setText("Issues detected")
-            self.status_label.setStyleSheet(
-                "color: #d04040; font-size: 11px; font-weight: 600;"
-                " background: none; border: none;"
-            )
-
-        # Update each test row
-        for test in result["tests"]:
-            name = test["test"]
-            passed = test["pass"]
-            if name not in self._test_rows:
-                continue
-            icon_label, name_label, status_label = self._test_rows[name]
-
-            if passed:
-                icon_label.setText("\u2714")
-                icon_label.setStyleSheet(
-                    "font-size: 16px; color: #2a9a5a; background: none; border: none;"
-                )
-                name_label.setStyleSheet(RANDOMNESS_TEST_PASS)
-                status_label.setText("PASS")
-                status_label.setStyleSheet(RANDOMNESS_TEST_PASS)
-            else:
-                icon_label.setText("\u2718")
-                icon_label.setStyleSheet(
-                    "font-size: 16px; color: #d04040; background: none; border: none;"
-                )
-                name_label.setStyleSheet(RANDOMNESS_TEST_FAIL)
-                status_label.setText("FAIL")
-                status_label.setStyleSheet(RANDOMNESS_TEST_FAIL)
-
-        # Overall
-        if all_pass:
-            self.overall_label.setText("\u2714  Entropy source is healthy")
-            self.overall_label.setStyleSheet(
-                "color: #2a9a5a; font-size: 14px; font-weight: 700;"
-                " background: none; border: none;"
-            )
-        else:
-            self.overall_label.setText("\u2718  Weak randomness detected!")
-            self.overall_label.setStyleSheet(
-                "color: #d04040; font-size: 14px; font-weight: 700;"
-                " background: none; border: none;"
-            )
-
-        self.close_btn.show()
+        self._running = False
+        # Apply every change below as one repaint (re-enabling schedules it)
+        self.setUpdatesEnabled(False)
+        try:
+            self.progress.setValue(100)
+
+            state, status, verdict = _OVERALL_OUTCOME[bool(result["pass"])]
+            self._set_overall_state(state)
+            self.status_label.setText(status)
+            self.overall_label.setText(verdict)
+
+            # Update each test row
+            for test in result["tests"]:
+                labels = self._test_rows.get(test["test"])
+                if labels is None:
+                    continue
+                state, status, mark = _TEST_OUTCOME[bool(test["pass"])]
+                labels[0].setPixmap(glyph_pixmap(*mark))
+                labels[2].setText(status)
+                for label in labels:
+                    set_style_state(label, "state", state)
+
+            self.close_btn.show()
+        finally:
+            self.setUpdatesEnabled(True)
 
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    QPixmapCache.setCacheLimit(20 * 1024)  # KB — room for every icon size
     window = SeedTestWindow()
     window.show()
     sys.exit(app.exec())
@@ -57,6 +57,7 @@ import struct
 import threading
 import time
 import unicodedata
+from collections import Counter
 
 try:
     from .crypto.argon2 import hash_secret_raw, Type as _Argon2Type
@@ -98,7 +99,6 @@ _BASE_WORDS = (
     "crown", "ring", "dice", "piece", "coin", "calendar", "boxing", "swimming",
     "game", "soccer", "ghost", "alien", "robot", "angel", "dragon", "clock",
 )
-_BASE = {i: w for i, w in enumerate(_BASE_WORDS)}
 
 # ── Language support (loaded from words.py at module level below) ──
 _LANGUAGES = {}  # populated after words.py is loaded
@@ -148,7 +148,19 @@ except ImportError:
     from words import LOOKUP as _LOOKUP, LANGUAGES as _LANGUAGES, DARK_VISUALS
 
 _SORTED_KEYS = sorted(_LOOKUP.keys())
-_INDEX_TO_BASE = _BASE  # index -> base English word
+
+# English base words as a sorted (word, index) table for prefix bisection
+_BASE_SORTED = sorted((w.lower(), i) for i, w in enumerate(_BASE_WORDS))
+_BASE_SORTED_KEYS = [w for w, _ in _BASE_SORTED]
+
+# All keys joined by newlines so substring search runs in C (str.find)
+# instead of a Python loop over every key; _KEY_STARTS maps offsets back.
+_KEYS_TEXT = "\n".join(_SORTED_KEYS)
+_KEY_STARTS = []
+_pos = 0
+for _k in _SORTED_KEYS:
+    _KEY_STARTS.append(_pos)
+    _pos += len(_k) + 1
 
 # Inner-word index for multi-word entries (e.g. "bàn tay" → searchable by "tay")
 _INNER_WORDS = []  # sorted list of (inner_word, full_key)
@@ -175,7 +187,13 @@ _INVISIBLE_CHARS = re.compile(
 _ARTICLE_SUFFIXES = ("inn", "ið", "ul", "in", "le", "en", "et", "a")
 
 # Scripts where stripping combining marks is safe
-_SAFE_STRIP_SCRIPTS = {"latin", "greek", "arabic", "hebrew", "cyrillic"}
+_SAFE_STRIP_SCRIPTS = frozenset({"latin", "greek", "arabic", "hebrew", "cyrillic"})
+
+# Latin letters with no combining-mark decomposition, spelled out instead
+_LATIN_LETTER_MAP = (
+    ("\u00df", "ss"), ("\u00f8", "o"), ("\u00e6", "ae"), ("\u0153", "oe"),
+    ("\u00f0", "d"), ("\u00fe", "th"), ("\u0142", "l"), ("\u0111", "d"),
+)
 
 
 def _normalize(word):
@@ -185,28 +203,42 @@ def _normalize(word):
     (full-width -> regular, ligatures -> letters), lowercases.
     """
     w = word.strip()
+    if w.isascii():
+        return w.lower()  # No invisible chars, and NFKC leaves ASCII as is
     w = _INVISIBLE_CHARS.sub("", w)
     w = unicodedata.normalize("NFKC", w)
     return w.lower()
 
 
+# Unicode-name prefix checks for _detect_script, in priority order
+_SCRIPT_NAME_TAGS = (
+    ("LATIN", "latin"), ("GREEK", "greek"), ("CYRILLIC", "cyrillic"),
+    ("ARABIC", "arabic"), ("HEBREW", "hebrew"),
+)
+_CHAR_SCRIPT = {}  # char -> script name (or None), filled as chars are seen
+
+
+def _char_script(c):
+    """Script of a single letter from its Unicode name (cached)."""
+    name = unicodedata.name(c, "")
+    for tag, script in _SCRIPT_NAME_TAGS:
+        if tag in name:
+            break
+    else:
+        script = None
+    _CHAR_SCRIPT[c] = script
+    return script
+
+
 def _detect_script(word):
     """Detect the primary script of a word."""
     script_counts = {}
     for c in word:
         if not c.isalpha():
             continue
-        name = unicodedata.name(c, "")
-        if "LATIN" in name:
-            script_counts["latin"] = script_counts.get("latin", 0) + 1
-        elif "GREEK" in name:
-            script_counts["greek"] = script_counts.get("greek", 0) + 1
-        elif "CYRILLIC" in name:
-            script_counts["cyrillic"] = script_counts.get("cyrillic", 0) + 1
-        elif "ARABIC" in name:
-            script_counts["arabic"] = script_counts.get("arabic", 0) + 1
-        elif "HEBREW" in name:
-            script_counts["hebrew"] = script_counts.get("hebrew", 0) + 1
+        script = _CHAR_SCRIPT[c] if c in _CHAR_SCRIPT else _char_script(c)
+        if script is not None:
+            script_counts[script] = script_counts.get(script, 0) + 1
     if not script_counts:
         return "other"
     return max(script_counts, key=script_counts.get)
@@ -226,8 +258,7 @@ def _strip_diacritics(word):
     result = word
 
     if script == "latin":
-        for old, new in {"\u00df": "ss", "\u00f8": "o", "\u00e6": "ae", "\u0153": "oe",
-                         "\u00f0": "d", "\u00fe": "th", "\u0142": "l", "\u0111": "d"}.items():
+        for old, new in _LATIN_LETTER_MAP:
             result = result.replace(old, new)
 
     if script == "cyrillic":
@@ -252,7 +283,15 @@ def _resolve_one(word, strict=False):
     strict=False (default): tries fallbacks (diacritics, articles, suffixes)
     strict=True: exact normalized lookup only — no fuzzy fallbacks
     """
-    t0 = time.perf_counter()
+    t0 = time.perf_counter() if DEBUG else 0.0
+
+    # Fast path: compile.py stores every key already normalized (and none is
+    # numeric), so a word that is a key as-is resolves without normalizing
+    result = _LOOKUP.get(word)
+    if result is not None:
+        if DEBUG: print(f"  [resolve] exact match '{word}' ->{result}  ({(time.perf_counter()-t0)*1000:.2f}ms)")
+        return result
+
     key = _normalize(word)
 
     # Numeric index (0-255)
@@ -279,8 +318,8 @@ def _resolve_one(word, strict=False):
         if DEBUG: print(f"  [resolve] no match for '{key}' (strict)  ({(time.perf_counter()-t0)*1000:.2f}ms)")
         return None
 
-    # Fallback: try diacritic-stripped version
-    stripped = _strip_diacritics(key)
+    # Fallback: try diacritic-stripped version (ASCII has none to strip)
+    stripped = key if key.isascii() else _strip_diacritics(key)
     if stripped != key:
         result = _LOOKUP.get(stripped)
         if result is not None:
@@ -316,7 +355,7 @@ def _resolve_one(word, strict=False):
             break
 
     # Fallback: strip definite-article suffixes (Scandinavian, Romanian, Icelandic)
-    if _detect_script(candidate) == "latin" and len(candidate) > 3:
+    if len(candidate) > 3 and _detect_script(candidate) == "latin":
         for suffix in _ARTICLE_SUFFIXES:
             if candidate.endswith(suffix) and len(candidate) - len(suffix) >= 2:
                 bare = candidate[:-len(suffix)]
@@ -397,6 +436,24 @@ def _search_sorted(sorted_keys, lookup, key, limit, seen_indexes):
     return results
 
 
+def _search_substring(key, limit, seen_indexes):
+    """Find entries containing key anywhere, in sorted-key order."""
+    results = []
+    if "\n" in key:
+        return results
+    pos = _KEYS_TEXT.find(key)
+    while pos != -1 and len(results) < limit:
+        i = bisect.bisect_right(_KEY_STARTS, pos) - 1
+        full_key = _SORTED_KEYS[i]
+        idx = _LOOKUP[full_key]
+        if idx not in seen_indexes:
+            seen_indexes.add(idx)
+            results.append((full_key, idx))
+        # Resume at the next key so each key matches at most once
+        pos = _KEYS_TEXT.find(key, _KEY_STARTS[i] + len(full_key) + 1)
+    return results
+
+
 def search(prefix, limit=10):
     """Suggest words matching a prefix, for search/autocomplete.
 
@@ -404,7 +461,7 @@ def search(prefix, limit=10):
     up to `limit` unique indexes. Words mapping to the same index are
     deduplicated (first alphabetical match wins).
     """
-    t0 = time.perf_counter()
+    t0 = time.perf_counter() if DEBUG else 0.0
     key = _normalize(prefix)
     if not key:
         return []
@@ -414,22 +471,19 @@ def search(prefix, limit=10):
         results = []
         for idx in range(256):
             if str(idx).startswith(key):
-                base = _INDEX_TO_BASE.get(idx, str(idx))
-                results.append((base, idx))
+                results.append((_BASE_WORDS[idx], idx))
                 if len(results) >= limit:
                     break
-        elapsed = (time.perf_counter() - t0) * 1000
-        if DEBUG: print(f"  [search] numeric prefix='{key}' ->{len(results)} results  ({elapsed:.2f}ms)")
+        if DEBUG: print(f"  [search] numeric prefix='{key}' ->{len(results)} results  ({(time.perf_counter()-t0)*1000:.2f}ms)")
         return results
 
     # Collect English base words that match the prefix first
-    english_first = []
-    seen_indexes = set()
-    for idx, base in _INDEX_TO_BASE.items():
-        if base.lower().startswith(key):
-            english_first.append((base.lower(), idx))
-            seen_indexes.add(idx)
-    english_first.sort()
+    lo = bisect.bisect_left(_BASE_SORTED_KEYS, key)
+    hi = lo
+    while hi < len(_BASE_SORTED_KEYS) and _BASE_SORTED_KEYS[hi].startswith(key):
+        hi += 1
+    english_first = _BASE_SORTED[lo:hi]
+    seen_indexes = {idx for _, idx in english_first}
     if len(english_first) > limit:
         english_first = english_first[:limit]
 
@@ -466,24 +520,18 @@ def search(prefix, limit=10):
 
     # Substring matching — find entries containing the search term anywhere
     if remaining > 0 and len(key) >= 2:
-        for full_key in _SORTED_KEYS:
-            if remaining <= 0:
-                break
-            if key in full_key:
-                idx = _LOOKUP[full_key]
-                if idx in seen_indexes:
-                    continue
-                seen_indexes.add(idx)
-                results.append((full_key, idx))
-                remaining -= 1
-
-    elapsed = (time.perf_counter() - t0) * 1000
-    if DEBUG: print(f"  [search] prefix='{key}' ->{len(results)} unique results  ({elapsed:.2f}ms)")
+        results += _search_substring(key, remaining, seen_indexes)
+
+    if DEBUG: print(f"  [search] prefix='{key}' ->{len(results)} unique results  ({(time.perf_counter()-t0)*1000:.2f}ms)")
     return results
 
 
 
 
+_pack_sample = struct.Struct("<iiQ").pack            # x, y, t
+_pack_sample_delta = struct.Struct("<iiQiiQ").pack  # x, y, t, dx, dy, dt
+
+
 class mouse_entropy:
     """Collects entropy from mouse movement samples.
 
@@ -521,15 +569,13 @@ class mouse_entropy:
         if x == self._last_x and y == self._last_y:
             return False
 
-        # Pack absolute position + timing
-        self._hasher.update(struct.pack("<iiQ", x, y, t))
-
-        # Hash deltas too — micro-movements carry extra entropy
-        if self._last_x is not None:
-            dx = x - self._last_x
-            dy = y - self._last_y
-            dt = t - self._last_t
-            self._hasher.update(struct.pack("<iiQ", dx, dy, dt))
+        # Absolute position + timing, then the deltas from the previous
+        # sample (micro-movements carry extra entropy) in the same update
+        if self._last_x is None:
+            self._hasher.update(_pack_sample(x, y, t))
+        else:
+            self._hasher.update(_pack_sample_delta(
+                x, y, t, x - self._last_x, y - self._last_y, t - self._last_t))
 
         self._last_x = x
         self._last_y = y
@@ -664,6 +710,9 @@ def _hardware_rng_entropy():
     return h.digest()
 
 
+_pack_timestamps = struct.Struct("<32Q").pack  # Source 3: 32 perf_counter_ns readings
+
+
 def _collect_entropy(n_bytes, extra_entropy=None):
     """Collect entropy from multiple sources and mix via SHA-512.
 
@@ -688,8 +737,7 @@ def _collect_entropy(n_bytes, extra_entropy=None):
     # Source 3: High-resolution timing jitter
     # The LSBs of perf_counter_ns contain hardware clock noise that is
     # unpredictable even to an attacker who controls the OS CSPRNG
-    for _ in range(32):
-        pool.extend(struct.pack("<Q", time.perf_counter_ns()))
+    pool.extend(_pack_timestamps(*[time.perf_counter_ns() for _ in range(32)]))
 
     # Source 4: Process-level uniqueness
     pool.extend(struct.pack("<I", os.getpid()))
@@ -719,14 +767,13 @@ def _collect_entropy(n_bytes, extra_entropy=None):
     if n_bytes <= 64:
         return digest[:n_bytes]
 
-    # For sizes > 64 bytes (unlikely), use HKDF-style expand
-    out = bytearray()
-    counter = 1
+    # For sizes > 64 bytes (e.g. the validation sample), use HKDF-style expand
+    n = (n_bytes + 63) // 64
+    out = bytearray(64 * n)
     prev = b""
-    while len(out) < n_bytes:
-        prev = hashlib.sha512(prev + digest + struct.pack("B", counter)).digest()
-        out.extend(prev)
-        counter += 1
+    for i in range(n):
+        prev = hashlib.sha512(prev + digest + bytes((i + 1,))).digest()
+        out[64 * i:64 * (i + 1)] = prev
     return bytes(out[:n_bytes])
 
 
@@ -745,7 +792,8 @@ def generate_words(word_count=36, extra_entropy=None, language=None):
     drawn from the same sources and tested with four statistical tests
     (monobit, chi-squared, runs, autocorrelation). If any test fails,
     the sample is discarded and the pipeline is retried — up to 10
-    attempts. Only after validation passes is the actual seed generated.
+    attempts. The seed's random words are taken from the sample that
+    passed, so only validated entropy is ever used.
 
     Args:
         word_count: 24 (176-bit, 22 random + 2 checksum) or
@@ -771,17 +819,16 @@ def generate_words(word_count=36, extra_entropy=None, language=None):
     if language and language != "english":
         word_map = _load_language(language)
     else:
-        word_map = _BASE
+        word_map = _BASE_WORDS
 
     for _ in range(_MAX_ENTROPY_RETRIES):
         # Validate the entropy pipeline with a large sample (1024 bytes)
         # so the statistical tests have enough data to detect real bias.
-        test_sample = _collect_entropy(_VALIDATION_SAMPLE_SIZE, extra_entropy)
-        tests = _test_entropy(test_sample)
+        sample = _collect_entropy(_VALIDATION_SAMPLE_SIZE, extra_entropy)
+        tests = _test_entropy(sample)
         if all(t["pass"] for t in tests.values()):
-            # Pipeline is healthy — now generate the random words
-            entropy = _collect_entropy(data_count, extra_entropy)
-            indexes = list(entropy)
+            # Sample is healthy — the random words come from it directly
+            indexes = list(sample[:data_count])
             # Append 2 checksum words
             indexes.extend(_compute_checksum(indexes))
             return [(idx, word_map[idx]) for idx in indexes]
@@ -818,12 +865,12 @@ def verify_checksum(seed):
 def _hkdf_expand(prk, info, length):
     """HKDF-Expand (RFC 5869) using HMAC-SHA512."""
     n = (length + 63) // 64  # SHA-512 = 64-byte blocks
-    okm = b""
+    blocks = []
     prev = b""
     for i in range(1, n + 1):
-        prev = hmac.new(prk, prev + info + bytes([i]), hashlib.sha512).digest()
-        okm += prev
-    return okm[:length]
+        prev = hmac.digest(prk, prev + info + bytes([i]), "sha512")
+        blocks.append(prev)
+    return b"".join(blocks)[:length]
 
 
 def _stretch(prk):
@@ -836,7 +883,8 @@ def _stretch(prk):
     """
     salt = _DOMAIN + b"-stretch"
 
-    # Stage 1: PBKDF2-SHA512
+    # Stage 1: PBKDF2-SHA512 — hashlib runs the whole iteration loop in
+    # OpenSSL and releases the GIL, so background callers don't stall a UI
     stage1 = hashlib.pbkdf2_hmac(
         "sha512",
         prk,
@@ -930,9 +978,10 @@ def get_seed(words, passphrase=""):
     indexes = data
 
     # Step 1: Position-tagged payload — each data icon is bound to its slot
-    payload = b""
-    for pos, idx in enumerate(indexes):
-        payload += struct.pack("<BB", pos, idx)
+    # (pos, idx) byte pairs, interleaved in one buffer
+    payload = bytearray(2 * len(indexes))
+    payload[0::2] = range(len(indexes))
+    payload[1::2] = indexes
 
     # Step 2: Mix passphrase into payload (influences every downstream step)
     # NFKC normalization prevents cross-platform fund loss from different
@@ -1141,11 +1190,19 @@ def get_entropy_bits(word_count, passphrase=""):
 
     import math
 
-    has_lower = any(c.islower() for c in passphrase)
-    has_upper = any(c.isupper() for c in passphrase)
-    has_digit = any(c.isdigit() for c in passphrase)
-    has_symbol = any(not c.isalnum() and c.isascii() for c in passphrase)
-    has_unicode = any(ord(c) > 127 for c in passphrase)
+    # One pass over the distinct characters instead of five over the string
+    has_lower = has_upper = has_digit = has_symbol = has_unicode = False
+    for c in set(passphrase):
+        if c.islower():
+            has_lower = True
+        if c.isupper():
+            has_upper = True
+        if c.isdigit():
+            has_digit = True
+        if not c.isascii():
+            has_unicode = True
+        elif not c.isalnum():
+            has_symbol = True
 
     pool = 0
     if has_lower:
@@ -1174,6 +1231,13 @@ def kdf_info():
             f"+ Argon2id (mem={_ARGON2_MEMORY}KB, t={_ARGON2_TIME}, p={_ARGON2_PARALLEL})")
 
 
+try:
+    _popcount = int.bit_count
+except AttributeError:  # Python < 3.10
+    def _popcount(v):
+        return bin(v).count("1")
+
+
 def _test_entropy(data):
     """Run statistical tests on raw bytes and return per-test results.
 
@@ -1181,19 +1245,21 @@ def _test_entropy(data):
     entropy before use) and verify_randomness (diagnostic UI).
 
     Returns a dict of {test_name: {pass, detail, ...}} for the four tests.
+
+    The bit-level tests treat the sample as one big integer (MSB-first,
+    like reading the bytes in order), so counting runs in C: bit i of the
+    stream is bit n_bits-1-i of the integer.
     """
     import math
 
+    data = bytes(data)
     n_bits = len(data) * 8
-    bits = []
-    for byte in data:
-        for bit_pos in range(7, -1, -1):
-            bits.append((byte >> bit_pos) & 1)
+    v = int.from_bytes(data, "big")
 
     results = {}
 
     # ── Test 1: Monobit (frequency) test ─────────────────────
-    ones = sum(bits)
+    ones = _popcount(v)
     s = abs(2 * ones - n_bits) / math.sqrt(n_bits)
     monobit_pass = s < 2.576
     results["monobit"] = {
@@ -1205,11 +1271,11 @@ def _test_entropy(data):
     }
 
     # ── Test 2: Chi-squared byte frequency ───────────────────
-    observed = [0] * 256
-    for byte in data:
-        observed[byte] += 1
+    counts = Counter(data)  # One C-level pass over the bytes
     expected = len(data) / 256.0
-    chi2 = sum((o - expected) ** 2 / expected for o in observed)
+    # sum((o - e)^2 / e) == sum(o^2) / e - n, since the counts sum to n;
+    # byte values that never occur add nothing to sum(o^2)
+    chi2 = sum(o * o for o in counts.values()) / expected - len(data)
     chi2_pass = chi2 < 310.5
     results["chi_squared"] = {
         "pass": chi2_pass,
@@ -1225,10 +1291,8 @@ def _test_entropy(data):
         runs_pass = False
         runs_z = float("inf")
     else:
-        runs = 1
-        for i in range(1, n_bits):
-            if bits[i] != bits[i - 1]:
-                runs += 1
+        # Each 1 in v ^ (v >> 1) below the top bit is a transition
+        runs = 1 + _popcount((v ^ (v >> 1)) & ((1 << (n_bits - 1)) - 1))
         expected_runs = 2.0 * n_bits * pi * (1 - pi) + 1
         std_runs = 2.0 * math.sqrt(2.0 * n_bits) * pi * (1 - pi)
         if std_runs == 0:
@@ -1250,8 +1314,9 @@ def _test_entropy(data):
     worst_z = 0.0
     worst_offset = 0
     for d in range(1, 17):
-        matches = sum(1 for i in range(n_bits - d) if bits[i] == bits[i + d])
         total = n_bits - d
+        # Bits d apart differ where v ^ (v >> d) is set (low `total` bits)
+        matches = total - _popcount((v ^ (v >> d)) & ((1 << total) - 1))
         z = abs(2 * matches - total) / math.sqrt(total)
         if z > worst_z:
             worst_z = z
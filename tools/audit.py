@@ -20,29 +20,25 @@ print("=" * 70)
 print("WORD LENGTH AUDIT")
 print("=" * 70)
 
-# Per-language stats
+# Per-language stats (word counts are kept for the summary below)
+variant_counts = []
 for lang_file in lang_files:
     mod = importlib.import_module(f"languages.{lang_file}")
     label = getattr(mod, "LABEL", lang_file)
     sw = getattr(mod, "SEED_WORDS", {})
 
-    # For each index, find shortest word length
-    shortest_per_idx = {}
-    for idx in range(256):
-        words = sw.get(idx, [])
-        if words:
-            shortest_per_idx[idx] = min(len(w) for w in words)
-        else:
-            shortest_per_idx[idx] = 999
+    # For each index, find shortest word length (999 if it has no words)
+    shortest_per_idx = [min(map(len, sw.get(idx, ())), default=999) for idx in range(256)]
 
-    long_indexes = [(idx, shortest_per_idx[idx]) for idx in range(256) if shortest_per_idx[idx] >= 8]
-    very_long = [(idx, shortest_per_idx[idx]) for idx in range(256) if shortest_per_idx[idx] >= 12]
+    long_indexes = [(idx, n) for idx, n in enumerate(shortest_per_idx) if n >= 8]
+    very_long = [(idx, n) for idx, n in long_indexes if n >= 12]
 
-    avg_shortest = sum(shortest_per_idx.values()) / 256
-    max_shortest = max(shortest_per_idx.values())
+    avg_shortest = sum(shortest_per_idx) / 256
+    max_shortest = max(shortest_per_idx)
 
     word_counts = [len(sw.get(idx, [])) for idx in range(256)]
-    single_word = sum(1 for c in word_counts if c <= 1)
+    single_word = word_counts.count(0) + word_counts.count(1)
+    variant_counts.append((label, word_counts, single_word))
 
     if long_indexes or single_word > 50:
         print(f"\n{label} ({lang_file}):")
@@ -63,13 +59,8 @@ print("\n" + "=" * 70)
 print("VARIANT COUNT SUMMARY (indexes with only 1 word)")
 print("=" * 70)
 
-for lang_file in lang_files:
-    mod = importlib.import_module(f"languages.{lang_file}")
-    label = getattr(mod, "LABEL", lang_file)
-    sw = getattr(mod, "SEED_WORDS", {})
-    word_counts = [len(sw.get(idx, [])) for idx in range(256)]
-    single = sum(1 for c in word_counts if c <= 1)
-    two = sum(1 for c in word_counts if c == 2)
-    three_plus = sum(1 for c in word_counts if c >= 3)
+for label, word_counts, single in variant_counts:
+    two = word_counts.count(2)
+    three_plus = 256 - single - two
     avg = sum(word_counts) / 256
     print(f"  {label:25s} 1-word: {single:3d}  2-word: {two:3d}  3+: {three_plus:3d}  avg: {avg:.1f}")
@@ -71,11 +71,37 @@ def normalize(word):
     4. Lowercase
     """
     w = word.strip()
+    if w.isascii():
+        return w.lower()  # No invisible chars, and NFKC leaves ASCII as is
     w = _INVISIBLE_CHARS.sub("", w)
     w = unicodedata.normalize("NFKC", w)
     return w.lower()
 
 
+# Unicode-name checks for detect_script, in priority order
+_SCRIPT_NAME_TAGS = (
+    (("LATIN",), "latin"), (("GREEK",), "greek"), (("CYRILLIC",), "cyrillic"),
+    (("ARABIC",), "arabic"), (("HEBREW",), "hebrew"), (("THAI",), "thai"),
+    (("DEVANAGARI",), "devanagari"), (("BENGALI",), "bengali"),
+    (("TAMIL",), "tamil"), (("TELUGU",), "telugu"), (("GURMUKHI",), "gurmukhi"),
+    (("CJK", "KANGXI"), "cjk"), (("HANGUL",), "hangul"),
+    (("HIRAGANA", "KATAKANA"), "kana"),
+)
+_CHAR_SCRIPT = {}  # char -> script name (or None), filled as chars are seen
+
+
+def _char_script(c):
+    """Script of a single letter from its Unicode name (cached)."""
+    name = unicodedata.name(c, "")
+    for tags, script in _SCRIPT_NAME_TAGS:
+        if any(tag in name for tag in tags):
+            break
+    else:
+        script = None
+    _CHAR_SCRIPT[c] = script
+    return script
+
+
 def detect_script(word):
     """Detect the primary script of a word.
 
@@ -83,39 +109,16 @@ def detect_script(word):
     'thai', 'devanagari', 'bengali', 'tamil', 'telugu', 'gurmukhi',
     'cjk', 'hangul', 'kana', or 'other'.
     """
+    if word.isascii():
+        # The only ASCII letters are Latin ones
+        return "latin" if any(c.isalpha() for c in word) else "other"
     script_counts = {}
     for c in word:
         if not c.isalpha():
             continue
-        name = unicodedata.name(c, "")
-        if "LATIN" in name:
-            script_counts["latin"] = script_counts.get("latin", 0) + 1
-        elif "GREEK" in name:
-            script_counts["greek"] = script_counts.get("greek", 0) + 1
-        elif "CYRILLIC" in name:
-            script_counts["cyrillic"] = script_counts.get("cyrillic", 0) + 1
-        elif "ARABIC" in name:
-            script_counts["arabic"] = script_counts.get("arabic", 0) + 1
-        elif "HEBREW" in name:
-            script_counts["hebrew"] = script_counts.get("hebrew", 0) + 1
-        elif "THAI" in name:
-            script_counts["thai"] = script_counts.get("thai", 0) + 1
-        elif "DEVANAGARI" in name:
-            script_counts["devanagari"] = script_counts.get("devanagari", 0) + 1
-        elif "BENGALI" in name:
-            script_counts["bengali"] = script_counts.get("bengali", 0) + 1
-        elif "TAMIL" in name:
-            script_counts["tamil"] = script_counts.get("tamil", 0) + 1
-        elif "TELUGU" in name:
-            script_counts["telugu"] = script_counts.get("telugu", 0) + 1
-        elif "GURMUKHI" in name:
-            script_counts["gurmukhi"] = script_counts.get("gurmukhi", 0) + 1
-        elif "CJK" in name or "KANGXI" in name:
-            script_counts["cjk"] = script_counts.get("cjk", 0) + 1
-        elif "HANGUL" in name:
-            script_counts["hangul"] = script_counts.get("hangul", 0) + 1
-        elif "HIRAGANA" in name or "KATAKANA" in name:
-            script_counts["kana"] = script_counts.get("kana", 0) + 1
+        script = _CHAR_SCRIPT[c] if c in _CHAR_SCRIPT else _char_script(c)
+        if script is not None:
+            script_counts[script] = script_counts.get(script, 0) + 1
 
     if not script_counts:
         return "other"
@@ -130,6 +133,12 @@ _SAFE_STRIP_SCRIPTS = {"latin", "greek", "arabic", "hebrew", "cyrillic"}
 # (tone marks, nukta, anusvara, etc. change the word)
 # Thai, Devanagari, Bengali, Tamil, Telugu, Gurmukhi, CJK, Hangul, Kana
 
+# Latin letters with no NFKD decomposition, mapped to their plain spelling
+_LATIN_REPLACEMENTS = (
+    ("ß", "ss"), ("ø", "o"), ("æ", "ae"), ("œ", "oe"),
+    ("ð", "d"), ("þ", "th"), ("ł", "l"), ("đ", "d"),
+)
+
 
 def strip_diacritics(word, script=None):
     """Remove optional diacritics/accents based on the word's script.
@@ -138,6 +147,8 @@ def strip_diacritics(word, script=None):
     NOT applied to: Thai, Devanagari, Bengali, Tamil, Telugu, Gurmukhi
     (where combining marks change meaning)
     """
+    if word.isascii():
+        return word  # Nothing to map or decompose
     if script is None:
         script = detect_script(word)
 
@@ -148,11 +159,7 @@ def strip_diacritics(word, script=None):
 
     # Latin-specific character mappings
     if script == "latin":
-        latin_replacements = {
-            "ß": "ss", "ø": "o", "æ": "ae", "œ": "oe",
-            "ð": "d", "þ": "th", "ł": "l", "đ": "d",
-        }
-        for old, new in latin_replacements.items():
+        for old, new in _LATIN_REPLACEMENTS:
             result = result.replace(old, new)
 
     # Cyrillic-specific: ё → е (extremely common in Russian)
@@ -209,11 +216,23 @@ def compile_lookup():
 
     print(f"Found {len(lang_files)} language files\n")
 
-    # Track all word → [(index, language)] mappings for collision detection
-    word_sources = {}  # normalized_word -> [(index, lang_name)]
+    # Flat lookup (first index wins) plus, for keys seen more than once,
+    # every later (index, language) pair for collision detection
+    lookup = {}        # normalized_word -> index
+    first_source = {}  # normalized_word -> lang_name that set the index
+    repeats = {}       # normalized_word -> [(index, lang_name)] after the first
     lang_stats = {}    # lang_name -> word count
     accent_variants = 0  # count of auto-generated accent-stripped entries
 
+    def add(key, idx, source):
+        if key not in lookup:
+            lookup[key] = idx
+            first_source[key] = source
+        elif key in repeats:
+            repeats[key].append((idx, source))
+        else:
+            repeats[key] = [(idx, source)]
+
     for lang_file in lang_files:
         try:
             mod = importlib.import_module(f"languages.{lang_file}")
@@ -232,16 +251,14 @@ def compile_lookup():
         for idx, words in seed_words.items():
             idx = int(idx)
             for word in words:
-                for variant in get_variants(word):
+                vs = get_variants(word)
+                for variant in vs:
                     if not variant:
                         continue
-                    if variant not in word_sources:
-                        word_sources[variant] = []
-                    word_sources[variant].append((idx, label))
+                    add(variant, idx, label)
                     word_count += 1
 
                 # Count accent variants
-                vs = get_variants(word)
                 if len(vs) > 1:
                     accent_variants += len(vs) - 1
 
@@ -252,32 +269,28 @@ def compile_lookup():
     from languages.base import signer_universal_seed_base
     emoji_count = 0
     for idx, emoji, _word in signer_universal_seed_base:
-        e_norm = normalize_emoji(emoji)
+        e_raw = emoji.strip()
+        e_norm = normalize_emoji(e_raw)
         if not e_norm:
             continue
-        if e_norm not in word_sources:
-            word_sources[e_norm] = []
-        word_sources[e_norm].append((idx, "emoji"))
+        add(e_norm, idx, "emoji")
         emoji_count += 1
         # Also store with variation selectors intact
-        e_raw = emoji.strip()
         if e_raw != e_norm:
-            if e_raw not in word_sources:
-                word_sources[e_raw] = []
-            word_sources[e_raw].append((idx, "emoji"))
+            add(e_raw, idx, "emoji")
             emoji_count += 1
     print(f"\n  Emoji entries added: {emoji_count}")
 
     # Detect collisions: same word → different indexes
     collisions = []
-    for word, sources in word_sources.items():
-        indexes = set(idx for idx, _ in sources)
-        if len(indexes) > 1:
-            collisions.append((word, sources))
+    for word, later in repeats.items():
+        first_idx = lookup[word]
+        if any(idx != first_idx for idx, _ in later):
+            collisions.append((word, [(first_idx, first_source[word])] + later))
 
     print(f"\n{'='*60}")
     print(f"Total languages: {len(lang_stats)}")
-    print(f"Total unique lookup keys: {len(word_sources)}")
+    print(f"Total unique lookup keys: {len(lookup)}")
     print(f"Auto-generated accent-stripped variants: {accent_variants}")
 
     if collisions:
@@ -305,11 +318,6 @@ def compile_lookup():
         print("Collisions: NONE (clean!)")
         print(f"{'='*60}")
 
-    # Build flat lookup (for collisions, first index wins - but we warn above)
-    lookup = {}
-    for word, sources in word_sources.items():
-        lookup[word] = sources[0][0]
-
     # Build languages section: {code: {label, words: {idx: first_word}}}
     languages = {}
     for lang_file in lang_files:
@@ -364,8 +372,7 @@ def compile_lookup():
     with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
         f.write("# Auto-generated by tools/compile.py — do not edit manually.\n\n")
         f.write("LOOKUP = {\n")
-        for word, idx in lookup.items():
-            f.write(f"    {word!r}: {idx},\n")
+        f.write("".join(f"    {word!r}: {idx},\n" for word, idx in lookup.items()))
         f.write("}\n\n")
         f.write("LANGUAGES = {\n")
         for lang_code in sorted(languages):
@@ -21,6 +21,8 @@ import os
 import re
 import sys
 import unicodedata
+from collections import defaultdict
+from functools import lru_cache
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_DIR = os.path.dirname(SCRIPT_DIR)
@@ -30,7 +32,6 @@ sys.path.insert(0, PROJECT_DIR)
 
 # Import base words for priority resolution
 from languages.base import signer_universal_seed_base
-BASE_WORDS = {entry[2].lower(): entry[0] for entry in signer_universal_seed_base}
 
 # Zero-width chars
 _INVISIBLE_CHARS = re.compile(
@@ -45,44 +46,68 @@ if sys.platform == "win32":
 
 def normalize(word):
     w = word.strip()
+    if w.isascii():
+        return w.lower()  # No invisible chars, and NFKC leaves ASCII as is
     w = _INVISIBLE_CHARS.sub("", w)
     w = unicodedata.normalize("NFKC", w)
     return w.lower()
 
 
+# Keyed by normalize() so lookups with normalized collision words can match
+BASE_WORDS = {normalize(entry[2]): entry[0] for entry in signer_universal_seed_base}
+
+
+_SCRIPT_NAME_TAGS = (
+    ("LATIN", "latin"), ("GREEK", "greek"), ("CYRILLIC", "cyrillic"),
+    ("ARABIC", "arabic"), ("HEBREW", "hebrew"),
+)
+_CHAR_SCRIPT = {}  # char -> script name (or None), filled as chars are seen
+
+
+def _char_script(c):
+    name = unicodedata.name(c, "")
+    for tag, script in _SCRIPT_NAME_TAGS:
+        if tag in name:
+            break
+    else:
+        script = None
+    _CHAR_SCRIPT[c] = script
+    return script
+
+
 def detect_script(word):
+    if word.isascii():
+        # The only ASCII letters are Latin ones
+        return "latin" if any(c.isalpha() for c in word) else "other"
     script_counts = {}
     for c in word:
         if not c.isalpha():
             continue
-        name = unicodedata.name(c, "")
-        if "LATIN" in name:
-            script_counts["latin"] = script_counts.get("latin", 0) + 1
-        elif "GREEK" in name:
-            script_counts["greek"] = script_counts.get("greek", 0) + 1
-        elif "CYRILLIC" in name:
-            script_counts["cyrillic"] = script_counts.get("cyrillic", 0) + 1
-        elif "ARABIC" in name:
-            script_counts["arabic"] = script_counts.get("arabic", 0) + 1
-        elif "HEBREW" in name:
-            script_counts["hebrew"] = script_counts.get("hebrew", 0) + 1
+        script = _CHAR_SCRIPT[c] if c in _CHAR_SCRIPT else _char_script(c)
+        if script is not None:
+            script_counts[script] = script_counts.get(script, 0) + 1
     if not script_counts:
         return "other"
     return max(script_counts, key=script_counts.get)
 
 
 _SAFE_STRIP_SCRIPTS = {"latin", "greek", "arabic", "hebrew", "cyrillic"}
+_LATIN_REPLACEMENTS = (
+    ("ß", "ss"), ("ø", "o"), ("æ", "ae"), ("œ", "oe"),
+    ("ð", "d"), ("þ", "th"), ("ł", "l"), ("đ", "d"),
+)
 
 
 def strip_diacritics(word, script=None):
+    if word.isascii():
+        return word  # Nothing to map or decompose
     if script is None:
         script = detect_script(word)
     if script not in _SAFE_STRIP_SCRIPTS:
         return word
     result = word
     if script == "latin":
-        for old, new in {"ß": "ss", "ø": "o", "æ": "ae", "œ": "oe",
-                         "ð": "d", "þ": "th", "ł": "l", "đ": "d"}.items():
+        for old, new in _LATIN_REPLACEMENTS:
             result = result.replace(old, new)
     if script == "cyrillic":
         result = result.replace("ё", "е").replace("Ё", "Е")
@@ -91,7 +116,13 @@ def strip_diacritics(word, script=None):
     return unicodedata.normalize("NFC", stripped)
 
 
+@lru_cache(maxsize=None)
 def get_variants(word):
+    # Cached: the same word recurs across languages and is looked up
+    # again by compute_removals
+    if word.isascii():
+        # ASCII words have no invisible chars or diacritics to strip
+        return frozenset((word.strip().lower(),))
     nw = normalize(word)
     variants = {nw}
     script = detect_script(nw)
@@ -99,7 +130,7 @@ def get_variants(word):
         stripped = strip_diacritics(nw, script)
         if stripped != nw:
             variants.add(stripped)
-    return variants
+    return frozenset(variants)
 
 
 def load_all_languages():
@@ -136,7 +167,7 @@ def find_collisions(languages):
     Returns dict: normalized_word -> {index -> [(lang_file, original_word, position_in_list)]}
     """
     # Track: normalized_word -> {index -> [(lang_file, original_word, pos)]}
-    word_map = {}
+    word_map = defaultdict(lambda: defaultdict(list))
 
     for lang_file, lang_data in languages.items():
         for idx, words in lang_data["seed_words"].items():
@@ -144,10 +175,6 @@ def find_collisions(languages):
                 for variant in get_variants(word):
                     if not variant:
                         continue
-                    if variant not in word_map:
-                        word_map[variant] = {}
-                    if idx not in word_map[variant]:
-                        word_map[variant][idx] = []
                     word_map[variant][idx].append((lang_file, word, pos))
 
     # Filter to only collisions (same word → multiple indexes)
@@ -172,27 +199,26 @@ def resolve_collision(norm_word, index_map):
         if base_idx in index_map:
             return base_idx
 
-    # Strategy 2: Check if the word is primary (position 0) in one index but not another
-    primary_indexes = []
-    secondary_indexes = []
+    # Gather per-index stats in a single pass over the sources
+    lang_counts = {}     # idx -> number of languages using the word there
+    primary_counts = {}  # idx -> number of sources where it is the first word
     for idx in indexes:
-        sources = index_map[idx]
-        has_primary = any(pos == 0 for _, _, pos in sources)
-        if has_primary:
-            primary_indexes.append(idx)
-        else:
-            secondary_indexes.append(idx)
+        langs = set()
+        primary_count = 0
+        for lang_file, _, pos in index_map[idx]:
+            langs.add(lang_file)
+            if pos == 0:
+                primary_count += 1
+        lang_counts[idx] = len(langs)
+        primary_counts[idx] = primary_count
+
+    # Strategy 2: Check if the word is primary (position 0) in one index but not another
+    primary_indexes = [idx for idx in indexes if primary_counts[idx]]
 
     if len(primary_indexes) == 1:
         return primary_indexes[0]
 
     # Strategy 3: Count how many languages use this word for each index
-    lang_counts = {}
-    for idx in indexes:
-        sources = index_map[idx]
-        unique_langs = set(lf for lf, _, _ in sources)
-        lang_counts[idx] = len(unique_langs)
-
     max_count = max(lang_counts.values())
     best_by_count = [idx for idx, c in lang_counts.items() if c == max_count]
 
@@ -200,14 +226,8 @@ def resolve_collision(norm_word, index_map):
         return best_by_count[0]
 
     # Strategy 4: If tied, prefer the index where it's a primary word across more languages
-    primary_lang_counts = {}
-    for idx in best_by_count:
-        sources = index_map[idx]
-        primary_count = sum(1 for _, _, pos in sources if pos == 0)
-        primary_lang_counts[idx] = primary_count
-
-    max_primary = max(primary_lang_counts.values())
-    best_by_primary = [idx for idx, c in primary_lang_counts.items() if c == max_primary]
+    max_primary = max(primary_counts[idx] for idx in best_by_count)
+    best_by_primary = [idx for idx in best_by_count if primary_counts[idx] == max_primary]
 
     if len(best_by_primary) == 1:
         return best_by_primary[0]
@@ -230,12 +250,10 @@ def compute_removals(collisions):
         for idx, sources in index_map.items():
             if idx == winner_idx:
                 continue
+            # Every source was recorded under norm_word by find_collisions,
+            # so each original word is known to produce it
             for lang_file, original_word, pos in sources:
-                # Check if this original word's variant caused the collision
-                # We need to verify the original word actually produces this norm_word
-                variants = get_variants(original_word)
-                if norm_word in variants:
-                    removals.append((lang_file, idx, original_word))
+                removals.append((lang_file, idx, original_word))
 
     return removals
 
@@ -246,12 +264,9 @@ def apply_removals(languages, removals):
     Returns set of modified lang_files.
     """
     # Group removals by (lang_file, idx) for efficiency
-    removal_map = {}  # (lang_file, idx) -> set of words to remove
+    removal_map = defaultdict(set)  # (lang_file, idx) -> set of words to remove
     for lang_file, idx, word in removals:
-        key = (lang_file, idx)
-        if key not in removal_map:
-            removal_map[key] = set()
-        removal_map[key].add(word)
+        removal_map[(lang_file, idx)].add(word)
 
     modified_files = set()
     total_removed = 0
@@ -279,8 +294,9 @@ def apply_removals(languages, removals):
                 new_list = [original_list[0]]
                 total_removed -= 1
 
-            seed_words[idx] = new_list
-            modified_files.add(lang_file)
+            if new_list != original_list:
+                seed_words[idx] = new_list
+                modified_files.add(lang_file)
 
     print(f"\nTotal words removed: {total_removed}")
     print(f"Files modified: {len(modified_files)}")
@@ -289,14 +305,16 @@ def apply_removals(languages, removals):
 
 
 def write_language_file(lang_file, lang_data):
-    """Rewrite a language file with updated SEED_WORDS."""
+    """Rewrite a language file with updated SEED_WORDS.
+
+    Returns False (and leaves the file untouched) if the content is unchanged.
+    """
     filepath = os.path.join(LANGUAGES_DIR, f"{lang_file}.py")
 
-    # Read original file to preserve LABEL and any comments at top
+    # Current contents, to skip the write when nothing changed
     with open(filepath, "r", encoding="utf-8") as f:
         original = f.read()
 
-    # Extract LABEL
     label = lang_data["label"]
 
     # Build new SEED_WORDS dict
@@ -319,9 +337,12 @@ def write_language_file(lang_file, lang_data):
     lines.append("")
 
     content = "\n".join(lines)
+    if content == original:
+        return False
 
     with open(filepath, "w", encoding="utf-8") as f:
         f.write(content)
+    return True
 
 
 def main():
@@ -346,8 +367,10 @@ def main():
 
     print(f"\nWriting {len(modified_files)} modified language files...")
     for lang_file in sorted(modified_files):
-        write_language_file(lang_file, languages[lang_file])
-        print(f"  Wrote {lang_file}.py")
+        if write_language_file(lang_file, languages[lang_file]):
+            print(f"  Wrote {lang_file}.py")
+        else:
+            print(f"  Unchanged {lang_file}.py")
 
     print("\nDone! Run compile.py to verify zero collisions.")
 